@@ -53,6 +53,8 @@ os.environ["GDAL_HTTP_COOKIEJAR"] = "~/cookies.txt"
 os.environ["GDAL_DISABLE_READDIR_ON_OPEN"] = "EMPTY_DIR"
 os.environ["CPL_VSIL_CURL_ALLOWED_EXTENSIONS"] = "TIF"
 NASA_EARTH_BEARER_TOKEN = os.getenv("NASA_EARTH_BEARER_TOKEN", "")
+# Upper bound on the threads fetching (date, band) tiles concurrently in get_data.
+MAX_GET_BAND_THREADS = 16
 
 
 def get_temp_creds():
@@ -204,6 +206,30 @@ def get_band(date_items, band, bbox, temp_creds_req, working_dir):
     return data
 
 
+def stack_bands_by_date(band_arrays, dates, bands):
+    """
+    Stacks the per-band arrays returned by get_band into a single time series.
+
+    Args:
+        band_arrays (list): Arrays from get_band in date-major order, i.e. every band
+            of dates[0], then every band of dates[1], and so on.
+        dates (list): The dates of the arrays, as 'YYYY-MM-DD' strings.
+        bands (list): The bands fetched for each date.
+
+    Returns:
+        xarray.DataArray: The arrays stacked along the 'band' and 'time' dimensions.
+    """
+    ds_list = []
+    for i, udate in enumerate(dates):
+        da = xr.concat(band_arrays[i * len(bands) : (i + 1) * len(bands)], dim="band")
+
+        data_date_datetime = datetime.strptime(udate, "%Y-%m-%d")
+        da = da.assign_coords({"band": bands, "time": data_date_datetime})
+
+        ds_list.append(da)
+    return xr.concat(ds_list, dim="time")
+
+
 ######################################################################################################
 ###  Connector class
 ######################################################################################################
@@ -413,25 +439,22 @@ class NASA_EarthData(Connector):
                 logger.warning("Warning: Unique dates and find_data results are None")
                 return None
 
-            ds: xr.DataArray
-            ds_list: list[Any] = []
-            for udate in unique_dates:  # type: ignore[union-attr]
-                date_items: list[Any] = []
-                for X in results:  # type: ignore[union-attr]
-                    if X["properties"]["datetime"].split("T")[0] == udate:
-                        date_items.append(X)
-                num_threads = len(bands)
-                ans = Parallel(n_jobs=num_threads, prefer="threads")(
-                    delayed(get_band)(date_items, b, bbox, temp_creds_req, working_dir)
-                    for b in tqdm(bands)
+            items_by_date: dict[str, list[Any]] = {
+                udate: [] for udate in unique_dates  # type: ignore[union-attr]
+            }
+            for X in results:  # type: ignore[union-attr]
+                items_by_date[X["properties"]["datetime"].split("T")[0]].append(X)
+            # Fetch every (date, band) in one pool so a slow tile on one date does
+            # not hold back the requests for the next.
+            tasks = [(udate, b) for udate in items_by_date for b in bands]
+            num_threads = max(1, min(len(tasks), MAX_GET_BAND_THREADS))
+            ans = Parallel(n_jobs=num_threads, prefer="threads")(
+                delayed(get_band)(
+                    items_by_date[udate], b, bbox, temp_creds_req, working_dir
                 )
-                da = xr.concat(ans, dim="band")
-
-                data_date_datetime = datetime.strptime(udate, "%Y-%m-%d")
-                da = da.assign_coords({"band": bands, "time": data_date_datetime})
-
-                ds_list.append(da)
-            ds = xr.concat(ds_list, dim="time")
+                for udate, b in tqdm(tasks)
+            )
+            ds = stack_bands_by_date(ans, list(items_by_date), bands)
 
             save_data_array_to_file(ds, save_file)
             deleteList = glob.glob(f"{working_dir}/links_*.vrt", recursive=True)
@@ -6,6 +6,7 @@
 
 import logging
 
+from typing import Optional
 from xarray import DataArray
 
 from terrakit.general_utils.exceptions import TerrakitBaseException
@@ -13,13 +14,18 @@ from terrakit.general_utils.exceptions import TerrakitBaseException
 logger = logging.getLogger(__name__)
 
 
-def scale_data_xarray(da: DataArray, scaling_factors: list) -> DataArray:
+def scale_data_xarray(
+    da: DataArray, scaling_factors: Optional[list] = None
+) -> DataArray:
     """
     Scale the values in an xarray DataArray by given scaling factors.
 
+    Bands with a scaling factor of 1 are left untouched rather than multiplied, and
+    `scaling_factors=None` returns the DataArray unchanged.
+
     Parameters:
         da (xarray.DataArray): The input DataArray.
-        scaling_factors (list): A list of scaling factors corresponding to each band.
+        scaling_factors (list, optional): A list of scaling factors corresponding to each band.
 
     Raises:
         TerrakitBaseException: If an error occurs during transformation.
@@ -27,8 +33,12 @@ def scale_data_xarray(da: DataArray, scaling_factors: list) -> DataArray:
     Returns:
         xarray.DataArray: The scaled DataArray.
     """
+    if scaling_factors is None:
+        return da
     try:
         for b in range(0, len(scaling_factors)):
+            if scaling_factors[b] == 1:
+                continue
             da[:, b] = da[:, b] * scaling_factors[b]
     except Exception as e:
         err_msg = f"An error occuring running 'scale_data_xarray' with '{scaling_factors=}': {e}"
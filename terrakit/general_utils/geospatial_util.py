@@ -4,6 +4,7 @@
 
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from rasterio.crs import CRS
 from rioxarray.exceptions import OneDimensionalRaster
 from shapely.geometry.polygon import Polygon
@@ -586,9 +587,7 @@ def reproject_bbox(
     if crs_from.to_epsg() == crs_to.to_epsg() and not is_360_degree_system:
         return bbox
 
-    transformer = pyproj.Transformer.from_crs(
-        crs_from=crs_from, crs_to=crs_to, always_xy=True
-    )
+    transformer = _get_transformer(src_crs=src_crs, dst_crs=dst_crs)
     minx, miny, maxx, maxy = bbox
     assert minx <= maxx, f"Error! {minx=} <= {maxx=} is false"
     assert miny <= maxy, f"Error! {miny=} <= {maxy=} is false"
@@ -626,6 +625,28 @@ def _convert_to_360_degree_system(values: list[float]) -> list[float]:
     return new_values
 
 
+@lru_cache(maxsize=256)
+def _get_transformer(
+    src_crs: Union[int, str], dst_crs: Union[int, str]
+) -> pyproj.Transformer:
+    """
+    Build, once per CRS pair, the always_xy transformer used by `reproject_bbox`.
+
+    Parameters:
+        src_crs (Union[int, str]): source CRS, as accepted by `_get_epsg`.
+        dst_crs (Union[int, str]): destination CRS, as accepted by `_get_epsg`.
+
+    Returns:
+        pyproj.Transformer: transformer from src_crs to dst_crs.
+    """
+    return pyproj.Transformer.from_crs(
+        crs_from=_get_epsg(crs_code=src_crs),
+        crs_to=_get_epsg(crs_code=dst_crs),
+        always_xy=True,
+    )
+
+
+@lru_cache(maxsize=256)
 def _get_epsg(crs_code: Union[str, int]) -> CRS:
     """
     Function to retrieve a pyproj CRS object from an EPSG code.
@@ -12,6 +12,9 @@ from tests.component_tests.chip.conftest import WORKING_DIR
 from tests.component_tests import component_tests_util
 
 
+pytestmark = pytest.mark.xdist_group(name="chip_working_dir")
+
+
 class TestChipAndLabel:
     @pytest.mark.parametrize(
         "working_dir, dataset_name,num_x, num_y, sample_dim",
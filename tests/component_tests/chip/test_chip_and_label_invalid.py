@@ -11,6 +11,9 @@ from terrakit.general_utils.exceptions import (
 from tests.component_tests.chip.conftest import WORKING_DIR
 
 
+pytestmark = pytest.mark.xdist_group(name="chip_working_dir")
+
+
 class TestChipAndLabel_FailureTests:
     def test_chip_and_label__invalid_suffix(
         self, chip_and_label_setup, chip_and_label_cleanup
@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
 import xarray as xr
 import numpy as np
@@ -24,6 +27,91 @@ def convert_angle_to_0_360(angle):
         return angle
 
 
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Hardlink a read-only file into place, copying it if the link is not possible
+    (e.g. across filesystems). Any existing dst is replaced.
+
+    Parameters:
+    src (str): The file to link.
+    dst (str): The path to create.
+
+    Returns:
+    str: dst, so it can be used as the copy_function of shutil.copytree.
+    """
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def count_tifs(directory: str) -> int:
+    """
+    Count the .tif files in a directory.
+
+    Parameters:
+    directory (str): The directory to search.
+
+    Returns:
+    int: The number of .tif files in the directory.
+    """
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries if e.name.endswith(".tif"))
+
+
+def classify_dir(
+    directory: str = "./tmp", dataset_name: str = "terrakit_curated_dataset"
+) -> dict[str, int]:
+    """
+    Count the download_data outputs in a directory with a single scan.
+
+    Parameters:
+    directory (str): The directory to search.
+    dataset_name (str): The dataset name used to prefix the outputs.
+
+    Returns:
+    dict[str, int]: Counts for the keys all_bboxes, labels, tif, imputed_labels and metadata.
+    """
+    counts = dict.fromkeys(
+        ("all_bboxes", "labels", "tif", "imputed_labels", "metadata"), 0
+    )
+    with os.scandir(directory) as entries:
+        for e in entries:
+            name = e.name
+            if name.startswith(f"{dataset_name}_all_bboxes"):
+                counts["all_bboxes"] += 1
+            elif name.startswith(f"{dataset_name}_labels"):
+                counts["labels"] += 1
+            elif name == f"{dataset_name}_metadata.json":
+                counts["metadata"] += 1
+            if name.endswith(".tif"):
+                counts["tif"] += 1
+                if name.endswith("_imputed_labels.tif"):
+                    counts["imputed_labels"] += 1
+    return counts
+
+
+@lru_cache(maxsize=None)
+def _linspace(start: float, stop: float, num: int) -> np.ndarray:
+    """
+    Memoised, read-only np.linspace shared between create_xarray calls.
+    """
+    coords = np.linspace(start, stop, num)
+    coords.flags.writeable = False
+    return coords
+
+
+@lru_cache(maxsize=None)
+def _date_range(start_date: str, periods: int, end_date: str) -> pd.DatetimeIndex:
+    """
+    Memoised pd.date_range shared between create_xarray calls.
+    """
+    return pd.date_range(start=start_date, periods=periods, end=end_date)
+
+
 def create_xarray(
     min_x: float,
     max_x: float,
@@ -42,14 +130,14 @@ def create_xarray(
     time_dim: str = "time",
 ) -> xr.DataArray | xr.Dataset:
     # Define the dimensions and their corresponding coordinates
-    time_coords = pd.date_range(start=start_date, periods=periods, end=end_date)
-    y_coords = np.linspace(min_y, max_y, size_y)
+    time_coords = _date_range(start_date, periods, end_date)
+    y_coords = _linspace(min_y, max_y, size_y)
     if is_360_degree_system:
         new_min_x = convert_angle_to_0_360(min_x)
         new_max_x = convert_angle_to_0_360(max_x)
-        x_coords = np.linspace(new_min_x, new_max_x, size_x)
+        x_coords = _linspace(new_min_x, new_max_x, size_x)
     else:
-        x_coords = np.linspace(min_x, max_x, size_x)
+        x_coords = _linspace(min_x, max_x, size_x)
 
     # Create some sample data with the desired shape
     data = np.random.rand(len(time_coords), len(x_coords), len(y_coords))
@@ -104,8 +192,17 @@ def create_netcdf_file(
     # Define the path for the NetCDF file
     path = working_dir / "test.nc"
 
-    # Save the xarray Dataset to a NetCDF file
-    ds.to_netcdf(path=path)
+    # Save the xarray Dataset to a NetCDF file. Writing one uncompressed chunk per time step
+    # through h5netcdf keeps HDF5 chunk metadata small and avoids an extra copy of the array.
+    ds.to_netcdf(
+        path=path,
+        engine="h5netcdf",
+        format="NETCDF4",
+        unlimited_dims=(),
+        encoding={
+            "temperature": {"chunksizes": (1, size_x, size_y), "compression": None}
+        },
+    )
 
     # Assert that the NetCDF file has been created
     assert path.exists()
@@ -2,49 +2,82 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-import dotenv
 import json
 import numpy as np
 import os
 import pystac
 import pytest
+import re
 import rioxarray
 import shutil
 import stackstac
+import tempfile
 import xarray as xr
 
+from functools import lru_cache
 from glob import glob
 from pathlib import Path
 from requests import HTTPError
 from sentinelhub import SentinelHubRequest
+from types import MappingProxyType
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 
+from terrakit import DataConnector
+from tests.component_tests.component_tests_util import link_or_copy
+
 
 ############################# Test Parameters ############################
 
-SAVE_FILE_DIR = "./tests/resources/component_test_data"
+SAVE_FILE_DIR_PREFIX = "save_file_dir"
 DEFAULT_WORKING_DIR = "./tmp"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def start_date():
     return "2024-01-01"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def end_date():
     return "2024-01-31"
 
 
 @pytest.fixture
 def bbox():
+    # Function-scoped: some connectors adjust the bbox list in place.
     return [34.671440, -0.090887, 34.706448, -0.087678]
 
 
+@pytest.fixture(scope="session")
+def _save_file_root(tmp_path_factory, worker_id):
+    return tmp_path_factory.mktemp(f"{SAVE_FILE_DIR_PREFIX}_{worker_id}")
+
+
 @pytest.fixture
-def save_file_dir():
-    return SAVE_FILE_DIR
+def save_file_dir(_save_file_root, request):
+    # One subdirectory per test under a per-worker root, so tests never see each
+    # other's outputs. mkdtemp keeps names unique across modules with equal test names.
+    prefix = re.sub(r"[^\w.-]", "_", request.node.name)[:64]
+    return tempfile.mkdtemp(prefix=f"{prefix}_", dir=_save_file_root)
+
+
+@pytest.fixture(scope="session")
+def dc_factory():
+    """
+    Return a factory that builds one DataConnector per connector_type and reuses it.
+
+    Tests that depend on connector construction itself (e.g. missing credentials) should
+    still instantiate DataConnector directly.
+    """
+    cache: dict[str, DataConnector] = {}
+
+    def _get(connector_type: str) -> DataConnector:
+        if connector_type not in cache:
+            cache[connector_type] = DataConnector(connector_type=connector_type)
+        return cache[connector_type]
+
+    yield _get
 
 
 ###################################################################################################
@@ -53,132 +86,156 @@ def save_file_dir():
 ############################# TEST SETUP AND TEARDOWN ############################
 
 
+CREDENTIAL_ENV_VARS = (
+    "SH_CLIENT_ID",
+    "SH_CLIENT_SECRET",
+    "NASA_EARTH_BEARER_TOKEN",
+    "CDSAPI_KEY",
+)
+
+
 @pytest.fixture
-def unset_evn_vars():
-    if (
-        os.getenv("SH_CLIENT_ID")
-        and os.getenv("SH_CLIENT_SECRET")
-        and os.getenv("NASA_EARTH_BEARER_TOKEN")
-        and os.getenv("CDSAPI_KEY")
-    ):
-        del os.environ["SH_CLIENT_ID"]
-        del os.environ["SH_CLIENT_SECRET"]
-        del os.environ["NASA_EARTH_BEARER_TOKEN"]
-        del os.environ["CDSAPI_KEY"]
+def reset_dot_env():
+    # Snapshot the credentials and restore them afterwards, instead of re-reading .env.
+    saved = {k: os.environ.get(k) for k in CREDENTIAL_ENV_VARS}
+    yield
+    for k, v in saved.items():
+        if v is None:
+            os.environ.pop(k, None)
+        else:
+            os.environ[k] = v
 
 
 @pytest.fixture
-def invalid_evn_vars():
-    os.environ["SH_CLIENT_ID"] = "<invalid>"
-    os.environ["SH_CLIENT_SECRET"] = "<invalid>"
-    os.environ["NASA_EARTH_BEARER_TOKEN"] = "<invalid>"
-    os.environ["CDSAPI_KEY"] = "<invalid>"
+def unset_evn_vars(reset_dot_env):
+    if all(os.getenv(k) for k in CREDENTIAL_ENV_VARS):
+        for k in CREDENTIAL_ENV_VARS:
+            del os.environ[k]
 
 
 @pytest.fixture
-def reset_dot_env():
-    yield
-    dotenv.load_dotenv()
+def invalid_evn_vars(reset_dot_env):
+    for k in CREDENTIAL_ENV_VARS:
+        os.environ[k] = "<invalid>"
 
 
 @pytest.fixture
-def get_data_clean_up():
+def get_data_clean_up(save_file_dir):
     yield
-    # Clean up both .tif and .nc files
-    tif_files = glob(f"{SAVE_FILE_DIR}/*.tif")
-    nc_files = glob(f"{SAVE_FILE_DIR}/*.nc")
-    files = tif_files + nc_files
-    print(f"Test clean up. Deleting {files}")
-    for f in files:
-        os.remove(f)
+    # Clean up both .tif and .nc files in a single directory scan
+    print(f"Test clean up. Deleting .tif and .nc files from {save_file_dir}")
+    with os.scandir(save_file_dir) as it:
+        for entry in it:
+            if entry.name.endswith((".tif", ".nc")):
+                os.unlink(entry.path)
+
+
+def _populate_shapefile_cache(cache_dir, prefixes):
+    for prefix in prefixes:
+        shp_files = glob(f"./tests/resources/component_test_data/download/{prefix}*")
+        for shp_file in shp_files:
+            shutil.copy(shp_file, cache_dir)
+    return cache_dir
+
+
+# The shapefiles are copied once per session into a "golden" directory; each test then
+# restores DEFAULT_WORKING_DIR from it with a single copytree instead of re-globbing.
+@pytest.fixture(scope="session")
+def _shapefile_cache(tmp_path_factory):
+    return _populate_shapefile_cache(
+        tmp_path_factory.mktemp("shp_cache"),
+        ["terrakit_curated_dataset_all_bbox", "terrakit_curated_dataset_labels"],
+    )
+
+
+@pytest.fixture(scope="session")
+def _shapefile_classes_cache(tmp_path_factory):
+    return _populate_shapefile_cache(
+        tmp_path_factory.mktemp("shp_classes_cache"),
+        [
+            "terrakit_curated_dataset_classes_all_bbox",
+            "terrakit_curated_dataset_classes_labels",
+        ],
+    )
 
 
 @pytest.fixture
-def download_data_setup():
+def download_data_setup(_shapefile_cache):
     print("Starting test...")
     # Ensure dir does not exist before starting
-    if os.path.exists(DEFAULT_WORKING_DIR):
-        print(f"{DEFAULT_WORKING_DIR} being deleted before starting the test...")
-        shutil.rmtree(DEFAULT_WORKING_DIR)
+    shutil.rmtree(DEFAULT_WORKING_DIR, ignore_errors=True)
     print(f"Creating {DEFAULT_WORKING_DIR}..")
-    Path(DEFAULT_WORKING_DIR).mkdir(parents=True, exist_ok=True)
-    shp_files = glob(
-        "./tests/resources/component_test_data/download/terrakit_curated_dataset_all_bbox*"
-    )
-    for shp_file in shp_files:
-        shutil.copy(shp_file, DEFAULT_WORKING_DIR)
-    shp_files = glob(
-        "./tests/resources/component_test_data/download/terrakit_curated_dataset_labels*"
-    )
-    for shp_file in shp_files:
-        shutil.copy(shp_file, DEFAULT_WORKING_DIR)
+    shutil.copytree(_shapefile_cache, DEFAULT_WORKING_DIR, dirs_exist_ok=True)
 
 
 @pytest.fixture
-def download_data_setup_classes():
+def download_data_setup_classes(_shapefile_classes_cache):
     """Setup fixture for multi-class label tests using pre-generated shapefiles."""
     print("Starting multi-class label test...")
     # Ensure dir does not exist before starting
-    if os.path.exists(DEFAULT_WORKING_DIR):
-        print(f"{DEFAULT_WORKING_DIR} being deleted before starting the test...")
-        shutil.rmtree(DEFAULT_WORKING_DIR)
+    shutil.rmtree(DEFAULT_WORKING_DIR, ignore_errors=True)
     print(f"Creating {DEFAULT_WORKING_DIR}..")
-    Path(DEFAULT_WORKING_DIR).mkdir(parents=True, exist_ok=True)
-
     # Copy pre-generated class label shapefiles
-    shp_files = glob(
-        "./tests/resources/component_test_data/download/terrakit_curated_dataset_classes_all_bbox*"
-    )
-    for shp_file in shp_files:
-        shutil.copy(shp_file, DEFAULT_WORKING_DIR)
-    shp_files = glob(
-        "./tests/resources/component_test_data/download/terrakit_curated_dataset_classes_labels*"
-    )
-    for shp_file in shp_files:
-        shutil.copy(shp_file, DEFAULT_WORKING_DIR)
+    shutil.copytree(_shapefile_classes_cache, DEFAULT_WORKING_DIR, dirs_exist_ok=True)
 
 
 ###################################################################################################
 
 
 ############################# NASA EARTHDATA helper functions and fixtures ############################
+@lru_cache(maxsize=None)
+def load_json_resource(path: str):
+    """
+    Parse a JSON test resource once and reuse the result on subsequent calls.
+
+    Every caller gets the same dicts and lists, so treat the result as read-only.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _nasa_find_items():
+    items = load_json_resource("./tests/resources/nasa_earthdata/find_items.json")
+    return tuple(MappingProxyType(item) for item in items)
+
+
 def find_data_nasa_earthdata(*args, **kwargs):
-    with open("./tests/resources/nasa_earthdata/find_items.json", "r") as f:
-        items = json.load(f)
-    return items
+    """
+    Mocked `find_items` result, shared read-only across calls.
+
+    The items are returned in a tuple, each wrapped in a MappingProxyType, so the list
+    and the top level of each item cannot be modified. Nested values such as
+    `item["properties"]` and `item["assets"]` are the dicts cached by
+    load_json_resource and are shared by every test, so treat them as read-only.
+    """
+    return _nasa_find_items()
 
 
 def mock_save_nasa_earthdata(*args, **kwargs):
     raster_file = kwargs["raster_path"].split("/")[-1]
+    # Copied rather than linked: save_cog reopens this file in "r+" mode to set band
+    # descriptions, which would otherwise write through to the shared resource.
     shutil.copy(
         "tests/resources/component_test_data/download/dummy.tif", f"./tmp/{raster_file}"
     )
 
 
 def stac_earthdata_response():
-    with open("./tests/resources/nasa_earthdata/connect_to_stac.json", "r") as f:
-        response = json.load(f)
-    return response
+    return load_json_resource("./tests/resources/nasa_earthdata/connect_to_stac.json")
 
 
 def stac_earthdata_lp_response():
-    with open(
-        "tests/resources/nasa_earthdata/connect_to_stac_search_lp_specific.json", "r"
-    ) as f:
-        response = json.load(f)
-    return response
+    return load_json_resource(
+        "./tests/resources/nasa_earthdata/connect_to_stac_search_lp_specific.json"
+    )
 
 
 def lp_search_earthdata_post_response():
-    with open("./tests/resources/nasa_earthdata/land_process_post.json", "r") as f:
-        response = json.load(f)
-    return response
+    return load_json_resource("./tests/resources/nasa_earthdata/land_process_post.json")
 
 
 def s3_cred_earthdata_url_response():
-    with open("tests/resources/nasa_earthdata/get_s3credentials.json", "r") as f:
-        response = json.load(f)
-    return response
+    return load_json_resource("./tests/resources/nasa_earthdata/get_s3credentials.json")
 
 
 @pytest.fixture
@@ -214,16 +271,27 @@ def mock_nasa_find_datasets(mocker, mock_setup_nasa):
     return mock_find_items_nasa
 
 
+@lru_cache(maxsize=1)
+def nasa_band_data_array():
+    """
+    Build the band returned by the mocked `get_band` once.
+
+    The values are never inspected by the tests, so a zero-copy broadcast view of a single
+    float32 scalar stands in for a full 3660x3660 tile.
+    """
+    return xr.DataArray(
+        np.broadcast_to(np.float32(0.5), (1, 3660, 3660)),
+        coords=[[1], np.arange(3660), np.arange(3660)],
+        dims=["band", "y", "x"],
+        attrs={"_FillValue": -9999, "scale_factor": 0.0001, "add_offset": 0.0},
+    )
+
+
 @pytest.fixture()
 def mock_nasa_download_datasets(mocker, mock_setup_nasa, mock_nasa_find_datasets):
     mock_get_band = mocker.patch(
         "terrakit.download.data_connectors.nasa_earthdata.get_band",
-        return_value=xr.DataArray(
-            np.random.rand(1, 3660, 3660),
-            coords=[[1], np.arange(3660), np.arange(3660)],
-            dims=["band", "y", "x"],
-            attrs={"_FillValue": -9999, "scale_factor": 0.0001, "add_offset": 0.0},
-        ),
+        return_value=nasa_band_data_array(),
     )
     mock_to_raster = mocker.patch(
         "rioxarray.raster_array.RasterArray.to_raster",
@@ -249,9 +317,15 @@ def expected_dates_sentinelhub() -> list:
     ]
 
 
+SENTINELHUB_CATALOG_SEARCH_URL = re.compile(
+    r"https://services(-uswest2)?\.sentinel-hub\.com/api/v1/catalog/1\.0\.0/search"
+)
+
+
 def catalog_search_response():
-    with open("./tests/resources/sentinelhub/find_data_results.json", "r") as f:
-        features = json.load(f)
+    features = load_json_resource(
+        "./tests/resources/sentinelhub/find_data_results.json"
+    )
     return {
         "type": "FeatureCollection",
         "features": features,
@@ -266,27 +340,22 @@ def catalog_search_response():
     }
 
 
+@pytest.fixture(scope="session")
+def _mock_setup_sentinelhub_payloads():
+    return {"catalog_search": catalog_search_response()}
+
+
 @pytest.fixture
-def mock_setup_sentinelhub(requests_mock):
-    requests_mock.get(
-        "https://services.sentinel-hub.com/api/v1/catalog/1.0.0/search",
-        json={},
-        status_code=200,
-    )
+def mock_setup_sentinelhub(requests_mock, _mock_setup_sentinelhub_payloads):
     requests_mock.post(
         "https://services.sentinel-hub.com/auth/realms/main/protocol/openid-connect/token",
         json={"access_token": "", "expires_at": 3601},
         status_code=200,
     )
-    res = catalog_search_response()
-    requests_mock.post(
-        "https://services-uswest2.sentinel-hub.com/api/v1/catalog/1.0.0/search",
-        json=res,
-        status_code=200,
-    )
+    # A single matcher covers both the default and the us-west-2 catalog endpoints.
     requests_mock.post(
-        "https://services.sentinel-hub.com/api/v1/catalog/1.0.0/search",
-        json=res,
+        SENTINELHUB_CATALOG_SEARCH_URL,
+        json=_mock_setup_sentinelhub_payloads["catalog_search"],
         status_code=200,
     )
     return requests_mock
@@ -322,7 +391,7 @@ class sh_request_mock(MagicMock):
         """
         Save test data files to the specified directory.
 
-        This method creates the destination directory if it doesn't exist and copies
+        This method creates the destination directory if it doesn't exist and hardlinks
         'response.tiff' and 'request.json' files from the source directory to the destination.
         """
         dst_dir = "./sh_data/test_data"
@@ -336,11 +405,11 @@ class sh_request_mock(MagicMock):
         src_tiff = f"{src_dir}/response.tiff"
         src_json = f"{src_dir}/request.json"
 
-        # Copy 'response.tiff' file
-        shutil.copyfile(src_tiff, f"{dst_dir}/response.tiff")
+        # Link 'response.tiff' file
+        link_or_copy(src_tiff, f"{dst_dir}/response.tiff")
 
-        # Copy 'request.json' file
-        shutil.copyfile(src_json, f"{dst_dir}/request.json")
+        # Link 'request.json' file
+        link_or_copy(src_json, f"{dst_dir}/request.json")
 
 
 ###################################################################################################
@@ -349,25 +418,35 @@ class sh_request_mock(MagicMock):
 ############################# SENTINEL AWS helper functions and fixtures ############################
 
 
-def mock_stac_aws_get_items(*args, **kwargs):
+@lru_cache(maxsize=1)
+def _cached_aws_items():
     catalog = pystac.Catalog(
         id="catalog-with-collection",
         catalog_type="FeatureCollection",
         description="Test catalog",
     )
-    with open("./tests/resources/sentinel_aws/items.json", "r") as f:
-        find_data_items = json.load(f)
+    find_data_items = load_json_resource("./tests/resources/sentinel_aws/items.json")
     stac_items = pystac.ItemCollection.from_dict(find_data_items, root=catalog)
     return stac_items
 
 
+def mock_stac_aws_get_items(*args, **kwargs):
+    # The connector only reads the collection, so one parsed instance is shared by all tests.
+    return _cached_aws_items()
+
+
+@pytest.fixture(scope="session")
+def _aws_stackstac_da():
+    # The lazy stack is built once; each test patches in its own shallow copy.
+    return stackstac.stack(mock_stac_aws_get_items(), epsg=4326, sortby_date="asc")
+
+
 @pytest.fixture
-def mock_stackstac(mocker):
+def mock_stackstac(mocker, _aws_stackstac_da):
     # The mock stac catalogue does not match the bbox for labels.shp so lets mock the stackstac call.
-    stac_items = mock_stac_aws_get_items()
     mock_stackstac_stack = mocker.patch(
         "stackstac.stack",
-        return_value=stackstac.stack(stac_items, epsg=4326, sortby_date="asc"),
+        return_value=_aws_stackstac_da.copy(deep=False),
     )
     print("Running mock for stack stac here")
     mock_stackstac_stack
@@ -382,13 +461,19 @@ def mock_aws_find_items(mocker):
     return mock_get_stac_items
 
 
+@pytest.fixture(scope="session")
+def _aws_sample_da():
+    # Loaded into memory once so later tests skip the GDAL open and decode.
+    return rioxarray.open_rasterio(
+        "tests/resources/sentinel_aws/aws_test_data.tif"
+    ).load()
+
+
 @pytest.fixture
-def mock_aws_get_data(mocker, mock_aws_find_items):
+def mock_aws_get_data(mocker, mock_aws_find_items, _aws_sample_da):
     mock_get_sh_aws_data = mocker.patch(
         "terrakit.download.data_connectors.sentinel_aws.get_sh_aws_data",
-        return_value=rioxarray.open_rasterio(
-            "tests/resources/sentinel_aws/aws_test_data.tif"
-        ),
+        return_value=_aws_sample_da.copy(deep=False),
     )
     return mock_aws_find_items, mock_get_sh_aws_data
 
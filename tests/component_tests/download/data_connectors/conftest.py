@@ -0,0 +1,21 @@
+# © Copyright IBM Corporation 2026
+# SPDX-License-Identifier: Apache-2.0
+
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def collections_cache(dc_factory):
+    """
+    Return a lookup that calls `list_collections()` once per connector_type per session.
+    """
+    cache: dict[str, list] = {}
+
+    def _get(connector_type: str) -> list:
+        if connector_type not in cache:
+            dc = dc_factory(connector_type)
+            cache[connector_type] = dc.connector.list_collections()
+        return cache[connector_type]
+
+    yield _get
@@ -19,22 +19,39 @@ from terrakit.general_utils.exceptions import (
     TerrakitValueError,
 )
 
+# The expected dates are static, so they are computed once at import time.
+_EXPECTED_CDS_DATES = tuple(
+    np.arange(
+        np.datetime64("2024-01-01"), np.datetime64("2024-02-01"), dtype="datetime64[D]"
+    )
+    .astype(str)
+    .tolist()
+)
+
 
+@pytest.mark.xdist_group(name="cds")
 class TestClimateDataStore:
     connector_type = "climate_data_store"
     # Mock data contains these 5 bands from the test zip file
     bands = ["fg10", "t2m", "tp", "u10", "v10"]
 
+    @pytest.fixture(autouse=True)
+    def block_live_requests(self, requests_mock):
+        """
+        Any HTTP request not registered on requests_mock raises NoMockAddress, so a CDS
+        test can never silently fall back to the live API.
+        """
+        return requests_mock
+
     @pytest.fixture
     def bbox(self):
         """Override default bbox with one large enough for ERA5 (0.25° resolution)."""
         # Kenya region: ~0.5° × 0.5° bbox (meets 0.25° minimum requirement)
         return [34.5, -0.5, 35.0, 0.0]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def expected_dates_cds(self):
-        dates = pd.date_range("2024-01-01", "2024-01-31").strftime("%Y-%m-%d").tolist()
-        return dates
+        return list(_EXPECTED_CDS_DATES)
 
     def test_valid_data_connector(self):
         dc = DataConnector(connector_type=self.connector_type)
@@ -42,14 +59,14 @@ class TestClimateDataStore:
 
     def test_list_collections_climate_data_store(
         self,
+        collections_cache,
         **kwargs,
     ):
         expected_collections = [
             "projections-cordex-domains-single-levels",
             "derived-era5-single-levels-daily-statistics",
         ]
-        dc = DataConnector(connector_type=self.connector_type)
-        collections = dc.connector.list_collections()
+        collections = collections_cache(self.connector_type)
         assert collections == expected_collections
 
     def test_missing_credentials_cds(
@@ -67,12 +84,12 @@ class TestClimateDataStore:
             dc = DataConnector(connector_type=self.connector_type)
             dc.connector.find_data(collection, start_date, start_date, bbox=bbox)
 
-    def test_invalid_collection(self, start_date, bbox):
+    def test_invalid_collection(self, dc_factory, start_date, bbox):
         """
         Test that an invalid collection raises a TerrakitValidationError.
         """
         collection = "invalid-collection"
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         with pytest.raises(TerrakitValueError, match="Invalid collection"):
             dc.connector.find_data(collection, start_date, start_date, bbox=bbox)
 
@@ -85,13 +102,14 @@ class TestClimateDataStore:
     )
     def test_find_available_data_cds(
         self,
+        dc_factory,
         collection,
         expected_dates_cds,
         start_date,
         end_date,
         bbox,
     ):
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         unique_dates, results = dc.connector.find_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -120,6 +138,7 @@ class TestClimateDataStore:
     )
     def test_find_available_data_cds__start_date_given_constraints(
         self,
+        dc_factory,
         collection,
         start_date,
         end_date,
@@ -129,7 +148,7 @@ class TestClimateDataStore:
         """
         Test the find_data method with a given start date within the collection constraints.
         """
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         unique_dates, results = dc.connector.find_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -140,7 +159,7 @@ class TestClimateDataStore:
         assert unique_dates == [start_date, end_date]
 
     def test_find_available_data_cds__bbox_expansion_for_small_bbox(
-        self, start_date, caplog
+        self, dc_factory, start_date, caplog
     ):
         """
         Test that find_data expands bbox smaller than ERA5 grid resolution (0.25°) and logs warning.
@@ -151,7 +170,7 @@ class TestClimateDataStore:
         tiny_bbox = [-1.32, 51.06, -1.30, 51.08]
         original_bbox = tiny_bbox.copy()
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         # Capture logs at WARNING level
         with caplog.at_level(logging.WARNING):
@@ -177,7 +196,7 @@ class TestClimateDataStore:
         )
 
     def test_find_available_data_cds__bbox_expansion_preserves_center_point(
-        self, start_date
+        self, dc_factory, start_date
     ):
         """
         Test that bbox expansion preserves the center point of the original bbox.
@@ -190,7 +209,7 @@ class TestClimateDataStore:
         orig_center_lon = (tiny_bbox[0] + tiny_bbox[2]) / 2
         orig_center_lat = (tiny_bbox[1] + tiny_bbox[3]) / 2
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         dc.connector.find_data(
             collection, start_date, start_date, bbox=tiny_bbox, bands=self.bands
         )
@@ -208,7 +227,7 @@ class TestClimateDataStore:
         )
 
     def test_find_available_data_cds__bbox_expansion_only_in_deficient_dimension(
-        self, start_date
+        self, dc_factory, start_date
     ):
         """
         Test that bbox expansion only expands dimensions that are too small.
@@ -218,7 +237,7 @@ class TestClimateDataStore:
         bbox_small_lat = [34.0, -0.01, 34.5, 0.01]  # 0.5° lon, 0.02° lat
         original_lon_span = bbox_small_lat[2] - bbox_small_lat[0]
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         dc.connector.find_data(
             collection, start_date, start_date, bbox=bbox_small_lat, bands=self.bands
         )
@@ -234,7 +253,7 @@ class TestClimateDataStore:
         assert new_lat_span >= 0.25, f"Latitude span {new_lat_span} should be >= 0.25°"
 
     def test_find_available_data_cds__bbox_no_expansion_when_sufficient(
-        self, start_date, caplog
+        self, dc_factory, start_date, caplog
     ):
         """
         Test that bbox is not expanded when it already meets minimum requirements.
@@ -245,7 +264,7 @@ class TestClimateDataStore:
         sufficient_bbox = [34.0, -0.25, 34.5, 0.25]
         original_bbox = sufficient_bbox.copy()
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         with caplog.at_level(logging.WARNING):
             dc.connector.find_data(
@@ -267,7 +286,7 @@ class TestClimateDataStore:
         ), "No warning should be logged when bbox is already sufficient"
 
     def test_find_available_data_cds__bbox_expansion_not_applied_to_cordex(
-        self, start_date
+        self, dc_factory, start_date
     ):
         """
         Test that bbox expansion is NOT applied to CORDEX collections (they use domain mapping).
@@ -276,7 +295,7 @@ class TestClimateDataStore:
         # Small bbox that would trigger expansion for ERA5
         tiny_bbox = [10.0, 45.0, 10.02, 45.02]
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         # CORDEX should use domain mapping, not bbox expansion
         # This should work without expanding the bbox (it maps to a domain instead)
@@ -289,7 +308,13 @@ class TestClimateDataStore:
         assert unique_dates is not None
 
     def test_get_data_cds__bbox_expansion(
-        self, mock_cds_client, start_date, save_file_dir, get_data_clean_up, caplog
+        self,
+        dc_factory,
+        mock_cds_client,
+        start_date,
+        save_file_dir,
+        get_data_clean_up,
+        caplog,
     ):
         """
         Test that get_data also expands small bboxes and logs warning.
@@ -301,7 +326,7 @@ class TestClimateDataStore:
         original_bbox = tiny_bbox.copy()
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}_small_bbox.nc"
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         with caplog.at_level(logging.WARNING):
             data = dc.connector.get_data(
@@ -332,7 +357,13 @@ class TestClimateDataStore:
         assert isinstance(data, xr.Dataset)
 
     def test_get_data__negative_longitude_conversion(
-        self, mock_cds_client, start_date, bbox, save_file_dir, get_data_clean_up
+        self,
+        dc_factory,
+        mock_cds_client,
+        start_date,
+        bbox,
+        save_file_dir,
+        get_data_clean_up,
     ):
         """
         Test that negative longitudes work correctly with ERA5 data.
@@ -346,7 +377,7 @@ class TestClimateDataStore:
         negative_lon_bbox = [-1.32, 51.70, -1.07, 51.95]
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}.nc"
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         # This should work - the connector should convert negative longitudes
         data = dc.connector.get_data(
@@ -371,7 +402,7 @@ class TestClimateDataStore:
             )
 
     def test_get_data__longitude_system_no_wraparound(
-        self, mock_cds_client, start_date, save_file_dir, get_data_clean_up
+        self, dc_factory, mock_cds_client, start_date, save_file_dir, get_data_clean_up
     ):
         """
         Test that bbox spanning negative to positive longitudes doesn't cause wraparound.
@@ -389,7 +420,7 @@ class TestClimateDataStore:
         bbox_europe = [-10, 40, 5, 50]  # Portugal to Germany
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}_europe.nc"
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         data = dc.connector.get_data(
             data_collection_name=collection,
@@ -465,6 +496,7 @@ class TestClimateDataStore:
     )
     def test_get_data_cds(
         self,
+        dc_factory,
         mock_cds_client,
         collection,
         bands,
@@ -483,7 +515,7 @@ class TestClimateDataStore:
         For CORDEX: 1950-01-01 to 1950-01-02 (historical data range)
         """
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}.nc"
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         data = dc.connector.get_data(
             data_collection_name=collection,
             date_start=date_start,
@@ -519,7 +551,7 @@ class TestClimateDataStore:
         assert os.path.exists(save_file.replace(".nc", "_2025-01-01.nc")) is False
 
     def test_get_data_bbox_too_small_for_era5_resolution(
-        self, mock_cds_client_bbox_error, start_date, save_file_dir
+        self, dc_factory, mock_cds_client_bbox_error, start_date, save_file_dir
     ):
         """
         Test that get_data handles Meteorological Archival and Retrieval System (MARS) error for bbox smaller than ERA5 grid resolution (0.25°).
@@ -533,7 +565,7 @@ class TestClimateDataStore:
         tiny_bbox = [-1.32, 51.06, -1.30, 51.08]
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}.nc"
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         with pytest.raises(
             TerrakitValidationError, match="CLIMATE DATA STORE REQUEST FAILED"
         ):
@@ -547,7 +579,7 @@ class TestClimateDataStore:
             )
 
     def test_get_data_cds__cordex_ignores_scalar_grid_mapping_variable(
-        self, tmp_path, monkeypatch
+        self, dc_factory, tmp_path, monkeypatch
     ):
         """
         Test CORDEX-like NetCDF processing ignores scalar grid-mapping variables such as
@@ -583,7 +615,7 @@ class TestClimateDataStore:
         with zipfile.ZipFile(zip_path, "w") as zf:
             zf.write(source_nc, arcname=source_nc.name)
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         monkeypatch.setattr(
             dc.connector,
@@ -620,7 +652,7 @@ class TestClimateDataStore:
         shutil.rmtree(working_dir, ignore_errors=True)
 
     def test_get_data_cds__cordex_saves_dates_without_dataset_level_time_coordinate(
-        self, tmp_path, monkeypatch
+        self, dc_factory, tmp_path, monkeypatch
     ):
         """
         Test saving daily files still works when merged Dataset has per-variable time
@@ -654,7 +686,7 @@ class TestClimateDataStore:
         with zipfile.ZipFile(zip_path, "w") as zf:
             zf.write(source_nc, arcname=source_nc.name)
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         monkeypatch.setattr(
             dc.connector,
@@ -692,7 +724,7 @@ class TestClimateDataStore:
         shutil.rmtree(working_dir, ignore_errors=True)
 
     def test_get_data_cds__cordex_supports_rotated_grid_spatial_dims(
-        self, tmp_path, monkeypatch
+        self, dc_factory, tmp_path, monkeypatch
     ):
         """
         Test CORDEX-like variables on rotated grids are processed when the data variable
@@ -746,7 +778,7 @@ class TestClimateDataStore:
 
         ds_in.close()
 
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         monkeypatch.setattr(
             dc.connector,
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from functools import lru_cache
+
 import pytest
 import xarray as xr
 from unittest.mock import patch
@@ -10,8 +12,7 @@ from terrakit.download.data_connectors import ibmresearch_stac
 
 from terrakit.download.raster_file_reader import NetCDFFileReader
 
-import pandas as pd
-import uuid
+import numpy as np
 
 from tests.component_tests.component_tests_util import (
     convert_angle_to_0_360,
@@ -22,6 +23,7 @@ from tests.component_tests.component_tests_util import (
 X_DIM = "x"
 Y_DIM = "y"
 TIME_DIM = "time"
+COLLECTION_IDS = ["fake-collection-id"]
 
 
 def list_collections(collection_ids: list[str]) -> list[dict]:
@@ -42,49 +44,71 @@ def list_items(
     end_dt: str,
     num_items: int = 10,
 ) -> list[dict]:
-    items = list()
     west, south, east, north = bbox
-    dates = pd.date_range(start=start_dt, end=end_dt, periods=num_items)
-    start = dates[0].date().isoformat()
-    end = dates[-1].date().isoformat()
-    for dt in dates:
-        i = {
-            "id": uuid.uuid4().hex,
+    # Evenly spaced timestamps between start_dt and end_dt, at second resolution.
+    secs = np.linspace(
+        np.datetime64(start_dt, "s").astype(np.int64),
+        np.datetime64(end_dt, "s").astype(np.int64),
+        num_items,
+    ).astype(np.int64)
+    dates = secs.astype("datetime64[s]").astype(str).tolist()
+    start = dates[0][:10]
+    end = dates[-1][:10]
+    # The dimensions and assets are the same for every item, so they are built once
+    # and shared by all items.
+    cube_dimensions = {
+        X_DIM: {
+            "type": "spatial",
+            "axis": "x",
+            "extent": [west, east],
+            "reference_system": 4326,
+        },
+        Y_DIM: {
+            "type": "spatial",
+            "axis": "y",
+            "extent": [south, north],
+            "reference_system": 4326,
+        },
+        TIME_DIM: {
+            "type": "temporal",
+            "extent": [start, end],
+        },
+    }
+    assets = {
+        "data": {
+            "href": "s3://fake-domain.B04.tif",
+            "type": "image/tiff; application=geotiff; profile=cloud-optimized",
+            "roles": ["data"],
+            "title": "B04",
+            "description": "",
+        }
+    }
+    bbox_list = list(bbox)
+    return [
+        {
+            "id": f"{collection_id}-{idx:04d}",
             "collection": collection_id,
-            "bbox": list(bbox),
-            "properties": {
-                "datetime": dt.isoformat(sep="T"),
-                "cube:dimensions": {
-                    X_DIM: {
-                        "type": "spatial",
-                        "axis": "x",
-                        "extent": [west, east],
-                        "reference_system": 4326,
-                    },
-                    Y_DIM: {
-                        "type": "spatial",
-                        "axis": "y",
-                        "extent": [south, north],
-                        "reference_system": 4326,
-                    },
-                    TIME_DIM: {
-                        "type": "temporal",
-                        "extent": [start, end],
-                    },
-                },
-            },
-            "assets": {
-                "data": {
-                    "href": "s3://fake-domain.B04.tif",
-                    "type": "image/tiff; application=geotiff; profile=cloud-optimized",
-                    "roles": ["data"],
-                    "title": "B04",
-                    "description": "",
-                }
-            },
+            "bbox": bbox_list,
+            "properties": {"datetime": dt, "cube:dimensions": cube_dimensions},
+            "assets": assets,
         }
-        items.append(i)
-    return items
+        for idx, dt in enumerate(dates)
+    ]
+
+
+@lru_cache(maxsize=None)
+def cached_items(
+    collection_id: str,
+    bbox: tuple[float, float, float, float],
+    start_dt: str,
+    end_dt: str,
+    num_items: int = 10,
+) -> tuple[dict, ...]:
+    """
+    Cached list_items payload. Item ids are derived from the item index, so the
+    payload is deterministic and can be shared between tests. Do not mutate it.
+    """
+    return tuple(list_items(collection_id, tuple(bbox), start_dt, end_dt, num_items))
 
 
 class MockResponse:
@@ -96,14 +120,14 @@ class MockResponse:
         end_dt: str,
         num_items: int = 10,
     ):
-        items = list_items(
+        items = cached_items(
             collection_id=collection_id,
-            bbox=bbox,
+            bbox=tuple(bbox),
             num_items=num_items,
             start_dt=start_dt,
             end_dt=end_dt,
         )
-        self.items = {"features": items}
+        self.items = {"features": list(items)}
 
     def raise_for_status(self):
         pass
@@ -112,12 +136,45 @@ class MockResponse:
         return self.items
 
 
+@lru_cache(maxsize=None)
+def cached_mock_response(
+    collection_id: str,
+    bbox: tuple,
+    start_dt: str,
+    end_dt: str,
+    num_items: int = 10,
+) -> MockResponse:
+    """Cached MockResponse. It is read-only after construction, so it can be shared."""
+    return MockResponse(collection_id, bbox, start_dt, end_dt, num_items)
+
+
 @pytest.fixture(scope="module")
+def cached_xarray():
+    """
+    Return a factory that builds each distinct create_xarray dataset once per module.
+    Callers get a shallow copy, so the cached dataset itself is never modified.
+    """
+    cache = {}
+
+    def _get(**kwargs):
+        key = tuple(
+            sorted(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()
+            )
+        )
+        if key not in cache:
+            cache[key] = create_xarray(**kwargs)
+        return cache[key].copy(deep=False)
+
+    return _get
+
+
+@pytest.fixture(scope="session")
 def conn() -> IBMResearchSTAC:
     with patch.object(
         IBMResearchSTAC,
         "_get_all_collections",
-        return_value=list_collections(["fake-collection-id"]),
+        return_value=list_collections(COLLECTION_IDS),
     ):
         conn = IBMResearchSTAC()
         # set mock property to avoid request
@@ -127,41 +184,41 @@ def conn() -> IBMResearchSTAC:
 
 def test_list_collections(conn: IBMResearchSTAC):
     collections = conn.list_collections()
-    assert ["fake-collection-id"] == collections
+    assert COLLECTION_IDS == collections
 
 
-def test_find_data(conn: IBMResearchSTAC):
+@pytest.mark.parametrize("data_collection_name", COLLECTION_IDS)
+def test_find_data(conn: IBMResearchSTAC, data_collection_name: str):
     date_end = "2020-01-01"
     date_start = "2000-01-01"
     bbox = (-180, -90, 180, 90)
     num_items = 10
-    for data_collection_name in conn.collections:
-        with patch.object(
-            ibmresearch_stac,
-            "post",
-            return_value=MockResponse(
-                collection_id=data_collection_name,
-                start_dt=date_start,
-                end_dt=date_end,
-                bbox=bbox,
-                num_items=num_items,
-            ),
-        ):
-            dates, metadata = conn.find_data(
-                data_collection_name=data_collection_name,
-                date_end=date_end,
-                date_start=date_start,
-                bbox=bbox,
-            )
-            assert isinstance(dates, list)
-            assert all(isinstance(d, str) for d in dates)
-            assert len(dates) == len(list(set(dates)))
-            assert isinstance(metadata, list)
-            assert len(metadata) == num_items
-            assert all(isinstance(md, dict) for md in metadata)
 
-            for item in metadata:
-                assert item["collection"] == data_collection_name
+    def mock_post(url, headers=None, payload=None):
+        return cached_mock_response(
+            collection_id=payload["collections"][0],
+            start_dt=date_start,
+            end_dt=date_end,
+            bbox=bbox,
+            num_items=num_items,
+        )
+
+    with patch.object(ibmresearch_stac, "post", side_effect=mock_post):
+        dates, metadata = conn.find_data(
+            data_collection_name=data_collection_name,
+            date_end=date_end,
+            date_start=date_start,
+            bbox=bbox,
+        )
+        assert isinstance(dates, list)
+        assert all(isinstance(d, str) for d in dates)
+        assert len(dates) == len(list(set(dates)))
+        assert isinstance(metadata, list)
+        assert len(metadata) == num_items
+        assert all(isinstance(md, dict) for md in metadata)
+
+        for item in metadata:
+            assert item["collection"] == data_collection_name
 
 
 @pytest.mark.parametrize(
@@ -187,14 +244,17 @@ def test_get_data(
     bands: list[str],
     is_360_degree_system: bool,
     conn: IBMResearchSTAC,
+    cached_xarray,
 ):
     collection_id = "fake-coll"
-    items = list_items(
-        collection_id=collection_id,
-        start_dt=start_dt,
-        end_dt=end_dt,
-        bbox=bbox,
-        num_items=periods,
+    items = list(
+        cached_items(
+            collection_id=collection_id,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            bbox=tuple(bbox),
+            num_items=periods,
+        )
     )
     min_x, min_y, max_x, max_y = bbox
     delta_space = 1.0
@@ -203,7 +263,7 @@ def test_get_data(
     x_res = (max_x - min_x) / size_x
     y_res = (max_y - min_y) / size_y
     with patch.object(IBMResearchSTAC, "_search_items", return_value=items):
-        ds = create_xarray(
+        ds = cached_xarray(
             start_date=start_dt,
             periods=periods,
             end_date=end_dt,
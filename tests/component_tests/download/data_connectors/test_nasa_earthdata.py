@@ -2,10 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import numpy as np
 import pytest
 import xarray as xr
 
-from terrakit import DataConnector
+from terrakit.download.data_connectors.nasa_earthdata import stack_bands_by_date
+
+
+pytestmark = pytest.mark.xdist_group(name="working_dir")
 
 
 class TestNASAEarthData:
@@ -14,12 +18,12 @@ class TestNASAEarthData:
 
     def test_list_collections_nasa_earthdata(
         self,
+        collections_cache,
         mock_setup_nasa,
         **kwargs,
     ):
         expected_collections = ["HLSS30_2.0", "HLSL30_2.0"]
-        dc = DataConnector(connector_type=self.connector_type)
-        collections = dc.connector.list_collections()
+        collections = collections_cache(self.connector_type)
         assert collections == expected_collections
 
     def test_list_collection_with_invalid_credentials_nasa_earthdata(
@@ -31,10 +35,18 @@ class TestNASAEarthData:
         """
         pass
 
-    @pytest.mark.parametrize("collection", ["HLSS30_2.0", "HLSL30_2.0"])
-    @pytest.mark.parametrize("maxcc", [100, 30])
+    @pytest.mark.parametrize(
+        ("collection", "maxcc"),
+        [
+            ("HLSS30_2.0", 100),
+            ("HLSS30_2.0", 30),
+            # The unfiltered path is already covered by HLSS30_2.0 above.
+            ("HLSL30_2.0", 30),
+        ],
+    )
     def test_find_available_data_nasa_earthdata(
         self,
+        dc_factory,
         mock_nasa_find_datasets,
         collection,
         start_date,
@@ -43,7 +55,7 @@ class TestNASAEarthData:
         maxcc,
     ):
         mock_find_items_nasa = mock_nasa_find_datasets
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         unique_dates, results = dc.connector.find_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -80,6 +92,7 @@ class TestNASAEarthData:
     )
     def test_get_data_nasa_earthdata(
         self,
+        dc_factory,
         mock_nasa_download_datasets,
         collection,
         start_date,
@@ -109,7 +122,7 @@ class TestNASAEarthData:
         )
 
         # Initialize DataConnector
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
 
         # Call the get_data method
         data_array = dc.connector.get_data(
@@ -127,3 +140,29 @@ class TestNASAEarthData:
         assert isinstance(data_array, xr.DataArray)
         assert len(data_array.coords["band"]) == len(self.bands)
         assert len(data_array.time) >= 1
+
+    def test_stack_bands_by_date(self):
+        """
+        Test that stack_bands_by_date regroups the date-major output of get_data's
+        thread pool so each value lands on its own date and band.
+        """
+        dates = ["2024-08-06", "2024-08-11"]
+        # Tag each array with its position in the pool's output.
+        band_arrays = [
+            xr.DataArray(
+                np.full((1, 2, 2), i, dtype=np.float32),
+                coords=[[1], np.arange(2), np.arange(2)],
+                dims=["band", "y", "x"],
+            )
+            for i in range(len(dates) * len(self.bands))
+        ]
+
+        data_array = stack_bands_by_date(band_arrays, dates, self.bands)
+
+        assert data_array.dims == ("time", "band", "y", "x")
+        assert list(data_array.band.values) == self.bands
+        assert [str(t)[:10] for t in data_array.time.values] == dates
+        for d, udate in enumerate(dates):
+            for b, band in enumerate(self.bands):
+                value = data_array.sel(time=udate, band=band).values
+                assert (value == d * len(self.bands) + b).all()
@@ -5,10 +5,9 @@
 import pytest
 import xarray as xr
 
-from glob import glob
 from rasterio.crs import CRS
 
-from terrakit import DataConnector
+from tests.component_tests.component_tests_util import count_tifs
 
 
 class TestSentinelAWS:
@@ -17,11 +16,11 @@ class TestSentinelAWS:
 
     def test_list_collections_sentinel_aws(
         self,
+        collections_cache,
         **kwargs,
     ):
         expected_collections = ["sentinel-2-l2a"]
-        dc = DataConnector(connector_type=self.connector_type)
-        collections = dc.connector.list_collections()
+        collections = collections_cache(self.connector_type)
         assert collections == expected_collections
 
     def test_list_collection_with_invalid_credentials_sentinel_aws(
@@ -36,9 +35,16 @@ class TestSentinelAWS:
     @pytest.mark.parametrize("collection", ["sentinel-2-l2a"])
     @pytest.mark.parametrize("maxcc", [80, 30])
     def test_find_available_data_sentinel_aws(
-        self, mock_aws_find_items, collection, start_date, end_date, bbox, maxcc
+        self,
+        dc_factory,
+        mock_aws_find_items,
+        collection,
+        start_date,
+        end_date,
+        bbox,
+        maxcc,
     ):
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         unique_dates, results = dc.connector.find_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -72,6 +78,7 @@ class TestSentinelAWS:
     @pytest.mark.parametrize("collection", ["sentinel-2-l2a"])
     def test_get_data_sentinel_aws(
         self,
+        dc_factory,
         mock_aws_get_data,
         collection,
         start_date,
@@ -81,7 +88,7 @@ class TestSentinelAWS:
         get_data_clean_up,
     ):
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}.tif"
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         data_array = dc.connector.get_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -98,4 +105,4 @@ class TestSentinelAWS:
         assert data_array.rio.crs == CRS.from_epsg(4326)
         assert len(data_array.coords["band"]) == len(self.bands)
         assert len(data_array.time) >= 1
-        assert len(glob(f"{save_file_dir}/*.tif")) == 7  # 7 unique dates found
+        assert count_tifs(save_file_dir) == 7  # 7 unique dates found
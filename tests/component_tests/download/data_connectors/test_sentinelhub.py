@@ -5,11 +5,12 @@
 import pytest
 import xarray as xr
 
-from glob import glob
 from rasterio.crs import CRS
 
+from tests.component_tests.component_tests_util import count_tifs
 
-from terrakit import DataConnector
+
+pytestmark = pytest.mark.xdist_group(name="working_dir")
 
 
 class TestSentinelHub:
@@ -18,6 +19,7 @@ class TestSentinelHub:
 
     def test_list_collections_sentinel_hub(
         self,
+        collections_cache,
         **kwargs,
     ):
         expected_collections = [
@@ -28,8 +30,7 @@ class TestSentinelHub:
             "s2_l2a",
             "hls_s30",
         ]
-        dc = DataConnector(connector_type=self.connector_type)
-        collections = dc.connector.list_collections()
+        collections = collections_cache(self.connector_type)
         assert collections == expected_collections
 
     def test_list_collection_with_invalid_credentials(
@@ -46,6 +47,7 @@ class TestSentinelHub:
     )
     def test_find_available_data_sentinelHub(
         self,
+        dc_factory,
         mock_setup_sentinelhub,
         collection,
         expected_dates_sentinelhub,
@@ -53,7 +55,7 @@ class TestSentinelHub:
         end_date,
         bbox,
     ):
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         unique_dates, results = dc.connector.find_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -77,6 +79,7 @@ class TestSentinelHub:
     )
     def test_get_data_sentinelhub(
         self,
+        dc_factory,
         mock_sentinelhub_save_data,
         collection,
         start_date,
@@ -105,7 +108,7 @@ class TestSentinelHub:
 
         """
         save_file = f"{save_file_dir}/{self.connector_type}_{collection}.tif"
-        dc = DataConnector(connector_type=self.connector_type)
+        dc = dc_factory(self.connector_type)
         data = dc.connector.get_data(
             data_collection_name=collection,
             date_start=start_date,
@@ -118,4 +121,4 @@ class TestSentinelHub:
         assert data.rio.crs == CRS.from_epsg(4326)
         assert len(data.coords["band"]) == len(self.bands)
         assert len(data.time) >= 1
-        assert len(glob(f"{save_file_dir}/*.tif")) == 7
+        assert count_tifs(save_file_dir) == 7
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from functools import lru_cache
+
 import pytest
 import xarray as xr
 from unittest.mock import patch
@@ -10,7 +12,47 @@ from terrakit.download.data_connectors.theweathercompany import TheWeatherCompan
 
 import pandas as pd
 import numpy as np
-import uuid
+import os
+
+
+_RNG = np.random.default_rng(0)
+
+# Start dates relative to the session's "today", resolved at test time rather than
+# at collection time.
+RELATIVE_DAYS = {"yesterday": -1, "today": 0, "tomorrow": 1}
+
+
+def resolve_date(date: str, today: pd.Timestamp) -> pd.Timestamp:
+    if date in RELATIVE_DAYS:
+        return today + pd.Timedelta(RELATIVE_DAYS[date], unit="D")
+    return pd.Timestamp(date)
+
+
+@lru_cache(maxsize=16)
+def _mock_dataframe_parts(
+    bbox: tuple, bands: tuple[str, ...], spatial_size: int, num_periods: int
+) -> tuple[pd.MultiIndex, np.ndarray]:
+    west, south, east, north = bbox
+    lat_index = np.linspace(south, north, spatial_size)
+    lon_index = np.linspace(west, east, spatial_size)
+    start = pd.Timestamp.today().date()
+    time_index = pd.date_range(start=start, periods=num_periods, freq="D")
+    # seconds since epoch, as returned by Timestamp.timestamp()
+    ts = time_index.as_unit("s").asi8.astype(np.float64)
+    # create multi-index with rows ordered by latitude, then longitude, then time
+    index = pd.MultiIndex.from_product(
+        [lat_index, lon_index, ts],
+        names=[
+            TheWeatherCompany.Y_DIM,
+            TheWeatherCompany.X_DIM,
+            TheWeatherCompany.TIME_DIM,
+        ],
+    ).reorder_levels(
+        [TheWeatherCompany.TIME_DIM, TheWeatherCompany.Y_DIM, TheWeatherCompany.X_DIM]
+    )
+    block = _RNG.random((len(index), len(bands)), dtype=np.float32)
+    block.flags.writeable = False
+    return index, block
 
 
 def mock_create_dataframe(
@@ -19,6 +61,9 @@ def mock_create_dataframe(
     """
     Generates a mock DataFrame with random data for specified bands, spatial size, and time periods.
 
+    The index and random data are cached per (bbox, bands, spatial_size, num_periods), so
+    repeated calls return the same values in a new DataFrame.
+
     Args:
         bbox (tuple): A tuple containing west, south, east, and north boundaries for spatial indexing.
         bands (list[str]): A list of band names for the DataFrame columns.
@@ -28,30 +73,11 @@ def mock_create_dataframe(
     Returns:
         pd.DataFrame: A DataFrame with multi-index containing time, latitude, and longitude dimensions.
     """
-    west, south, east, north = bbox
-    lat_index = np.linspace(south, north, spatial_size)
-    lon_index = np.linspace(west, east, spatial_size)
-    start = pd.Timestamp.today().date()
-    time_index = pd.date_range(start=start, periods=num_periods, freq="D")
-    ts = [t.timestamp() for t in time_index]
-    tuples = list()
-    for lat in lat_index:
-        for lon in lon_index:
-            for t in ts:
-                tuples.append((t, lat, lon))
-    # create multi-index
-    index = pd.MultiIndex.from_tuples(
-        tuples,
-        names=[
-            TheWeatherCompany.TIME_DIM,
-            TheWeatherCompany.Y_DIM,
-            TheWeatherCompany.X_DIM,
-        ],
+    index, block = _mock_dataframe_parts(
+        tuple(bbox), tuple(bands), spatial_size, num_periods
     )
-    data = dict()
-    for b in bands:
-        data[b] = np.random.uniform(0.0, 1.0, len(index))
-    return pd.DataFrame(data, index=index)
+    # copy=True so callers cannot modify the cached block through the DataFrame.
+    return pd.DataFrame(block, index=index, columns=list(bands), copy=True)
 
 
 def list_collections(collection_ids: list[str]) -> list[dict]:
@@ -74,9 +100,12 @@ def list_items(
 ) -> list[dict]:
     items = list()
     dates = pd.date_range(start=start_dt, end=end_dt, periods=num_items)
-    for dt in dates:
+    # One urandom read for all ids, split into 16-byte hex strings like uuid4().hex.
+    raw = os.urandom(16 * num_items)
+    ids = [raw[k * 16 : (k + 1) * 16].hex() for k in range(num_items)]
+    for k, dt in enumerate(dates):
         i = {
-            "id": uuid.uuid4().hex,
+            "id": ids[k],
             "collection": collection_id,
             "bbox": list(bbox),
             "properties": {"datetime": dt.isoformat(sep="T")},
@@ -113,19 +142,26 @@ class MockResponse:
     def json(self):
         temporal_dim = TheWeatherCompany.VALID_TIME_UTC
         temporal_size = self.get_temporal_size()
-        today = pd.Timestamp.today().date()
-        time_index = pd.date_range(start=today, periods=temporal_size, freq="D")
-        temporal_values = [t.timestamp() for t in time_index]
+        # daily timestamps from midnight today, in seconds since epoch
+        start_epoch = pd.Timestamp(pd.Timestamp.today().date()).timestamp()
+        days = np.arange(temporal_size, dtype=np.float64)
+        temporal_values = (start_epoch + days * 86400.0).tolist()
         data = {temporal_dim: temporal_values}
-        for band in self.bands:
-            data[band] = np.random.rand(len(time_index))
+        block = _RNG.random((temporal_size, len(self.bands)))
+        for i, band in enumerate(self.bands):
+            data[band] = block[:, i]
         return data
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def today() -> pd.Timestamp:
+    return pd.Timestamp.today().normalize()
+
+
+@pytest.fixture(scope="session")
 def conn() -> TheWeatherCompany:
+    # TheWeatherCompany holds no per-test state, so one instance is shared by all tests.
     conn = TheWeatherCompany()
-    # set mock property to avoid request
     return conn
 
 
@@ -137,28 +173,22 @@ def test_list_collections(conn: TheWeatherCompany):
 @pytest.mark.parametrize(
     "date_start, time_delta, expected_num_items, conn",
     [
-        (pd.Timestamp.today().date().isoformat(), 15, 15, "conn"),
-        (pd.Timestamp.today().date().isoformat(), 20, 15, "conn"),
-        (pd.Timestamp("2020-01-01").date().isoformat(), 20, 0, "conn"),
-        (
-            (pd.Timestamp.today() - pd.Timedelta(1, unit="D")).date().isoformat(),
-            15,
-            14,
-            "conn",
-        ),
-        (
-            (pd.Timestamp.today() + pd.Timedelta(1, unit="D")).date().isoformat(),
-            15,
-            14,
-            "conn",
-        ),
+        ("today", 15, 15, "conn"),
+        ("today", 20, 15, "conn"),
+        ("2020-01-01", 20, 0, "conn"),
+        ("yesterday", 15, 14, "conn"),
+        ("tomorrow", 15, 14, "conn"),
     ],
     indirect=["conn"],
 )
 def test_find_data(
-    date_start: str, time_delta: int, expected_num_items: int, conn: TheWeatherCompany
+    date_start: str,
+    time_delta: int,
+    expected_num_items: int,
+    conn: TheWeatherCompany,
+    today: pd.Timestamp,
 ):
-    date_start_ts = pd.Timestamp(date_start)
+    date_start_ts = resolve_date(date_start, today)
     date_end_ts = date_start_ts + pd.Timedelta(days=time_delta - 1)
     bbox = (-180, -90, 180, 90)
 
@@ -184,7 +214,7 @@ def test_find_data(
     "start_date, time_delta,bbox, bands, expected_dim_sizes, conn",
     [
         (
-            pd.Timestamp.today(),
+            "today",
             15,
             (-91, 40, -90, 41),
             ["temperatureMax"],
@@ -192,7 +222,7 @@ def test_find_data(
             "conn",
         ),
         (
-            pd.Timestamp.today(),
+            "today",
             12,
             (-91, 40, -90, 41),
             ["temperatureMax"],
@@ -200,7 +230,7 @@ def test_find_data(
             "conn",
         ),
         (
-            pd.Timestamp.today() + pd.Timedelta(1, unit="D"),
+            "tomorrow",
             15,
             (-91, 40, -90, 41),
             ["temperatureMax"],
@@ -211,14 +241,16 @@ def test_find_data(
     indirect=["conn"],
 )
 def test_get_data(
-    start_date: pd.Timestamp,
+    start_date: str,
     time_delta: int,
     bbox: tuple,
     bands: list[str],
     expected_dim_sizes: dict[str, int],
     conn: TheWeatherCompany,
+    today: pd.Timestamp,
 ):
     collection_id = TheWeatherCompany.DATA_COLLECTION_NAME
+    start_date = resolve_date(start_date, today)
     dt = start_date + pd.Timedelta(days=time_delta - 1)
     date_end: str = dt.date().isoformat()
     date_start: str = start_date.date().isoformat()
@@ -236,7 +268,7 @@ def test_get_data(
             f"Error! {arr.sizes} != {expected_dim_sizes}"
         )
         west, south, east, north = bbox
-        for lat in arr.latitude.values:
-            assert north >= lat >= south
-        for lon in arr.longitude.values:
-            assert east >= lon >= west
+        lats = arr.latitude.values
+        lons = arr.longitude.values
+        assert np.all((lats >= south) & (lats <= north)), f"Error! {lats=} outside bbox"
+        assert np.all((lons >= west) & (lons <= east)), f"Error! {lons=} outside bbox"
@@ -4,20 +4,37 @@
 
 import pytest
 
-from glob import glob
-
 from terrakit.download.download_data import download_data
 from terrakit.general_utils.exceptions import TerrakitValueError
+from tests.component_tests.component_tests_util import classify_dir
+
+
+pytestmark = pytest.mark.xdist_group(name="working_dir")
 
+# One data source per connector; the WorkingDir parametrize matrix is built from it.
+DATA_SOURCES = {
+    "sentinelhub": {
+        "data_connector": "sentinelhub",
+        "collection_name": "s2_l1c",
+        "bands": ["B04", "B03", "B02"],
+        "save_file": "",
+    },
+    "nasa_earthdata": {
+        "data_connector": "nasa_earthdata",
+        "collection_name": "HLSS30_2.0",
+        "bands": ["B04", "B03", "B02"],
+        "save_file": "",
+    },
+    "sentinel_aws": {
+        "data_connector": "sentinel_aws",
+        "collection_name": "sentinel-2-l2a",
+        "bands": ["blue", "green", "red"],
+        "save_file": "",
+    },
+}
 
-@pytest.mark.parametrize(
-    "connector_type, collection, bands",
-    (
-        ["sentinelhub", "s2_l1c", ["B04", "B03", "B02"]],
-        ["nasa_earthdata", "HLSS30_2.0", ["B04", "B03", "B02"]],
-        ["sentinel_aws", "sentinel-2-l2a", ["blue", "green", "red"]],
-    ),
-)
+
+@pytest.mark.parametrize("connector_type", DATA_SOURCES)
 class TestDownloadData_WorkingDir:
     def test_download_data__default(
         self,
@@ -28,22 +45,12 @@ class TestDownloadData_WorkingDir:
         mock_aws_get_data,
         mock_stackstac,
         connector_type,
-        collection,
-        bands,
     ):
         """Input: .shp file in default working dir
         Output: tiles in default working dir: ./tmp folder
         """
-        data_source = [
-            {
-                "data_connector": connector_type,
-                "collection_name": collection,
-                "bands": bands,
-                "save_file": "",
-            },
-        ]
         queried_data = download_data(
-            data_sources=data_source,
+            data_sources=[DATA_SOURCES[connector_type]],
             date_allowance={"pre_days": 0, "post_days": 21},
             transform={
                 "scale_data_xarray": True,
@@ -58,14 +65,11 @@ class TestDownloadData_WorkingDir:
             assert len(queried_data) == 14  # 7 unique dates for each event -> 7x2 =14
         elif connector_type == "nasa_earthdata":
             assert len(queried_data) == 10  # 5 unique dates for each event -> 5x2=10
-        assert (
-            len(glob("./tmp/terrakit_curated_dataset_all_bboxes*")) == 5
-        )  # bbox shp files
-        assert (
-            len(glob("./tmp/terrakit_curated_dataset_labels*")) == 5
-        )  # labels shp files
-        assert len(glob("./tmp/*.tif")) > 1
-        assert len(glob("./tmp/terrakit_curated_dataset_metadata.json")) == 1
+        counts = classify_dir("./tmp")
+        assert counts["all_bboxes"] == 5  # bbox shp files
+        assert counts["labels"] == 5  # labels shp files
+        assert counts["tif"] > 1
+        assert counts["metadata"] == 1
 
 
 class TestDownloadData_SetNoDataWithClasses:
@@ -84,17 +88,9 @@ class TestDownloadData_SetNoDataWithClasses:
         the set_no_data transformation correctly creates label rasters with
         proper class values and no-data handling.
         """
-        data_source = [
-            {
-                "data_connector": "sentinel_aws",
-                "collection_name": "sentinel-2-l2a",
-                "bands": ["blue", "green", "red"],
-                "save_file": "",
-            },
-        ]
         queried_data = download_data(
             dataset_name="terrakit_curated_dataset_classes",
-            data_sources=data_source,
+            data_sources=[DATA_SOURCES["sentinel_aws"]],
             date_allowance={"pre_days": 0, "post_days": 21},
             set_no_data=True,
             transform={
@@ -109,8 +105,8 @@ class TestDownloadData_SetNoDataWithClasses:
         assert len(queried_data) > 0
 
         # Verify label raster was created with proper naming
-        label_files = glob("./tmp/*_imputed_labels.tif")
-        assert len(label_files) > 0, "Expected label raster file to be created"
+        counts = classify_dir("./tmp", "terrakit_curated_dataset_classes")
+        assert counts["imputed_labels"] > 0, "Expected label raster file to be created"
 
         # Verify metadata was created
-        assert len(glob("./tmp/terrakit_curated_dataset_classes_metadata.json")) == 1
+        assert counts["metadata"] == 1
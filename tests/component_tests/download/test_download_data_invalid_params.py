@@ -8,6 +8,9 @@ from terrakit.download.download_data import download_data
 from terrakit.general_utils.exceptions import TerrakitValueError
 
 
+pytestmark = pytest.mark.xdist_group(name="working_dir")
+
+
 @pytest.mark.skip("WiP: test plan")
 class TestDownloadData_FailureTests:
     def test_download_data__(self):
@@ -46,7 +49,6 @@ class TestDownloadData_FailureTests:
         assert queried_data is not None
 
 
-
 class TestDownloadData_InvalidParams:
     """Test invalid parameter combinations for download_data"""
 
@@ -0,0 +1,54 @@
+# © Copyright IBM Corporation 2026
+# SPDX-License-Identifier: Apache-2.0
+
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from terrakit.download.transformations.scale_data_xarray import scale_data_xarray
+
+
+class TestScaleDataXarray:
+    """Test suite for scale_data_xarray, which scales each band by its own factor."""
+
+    @pytest.fixture
+    def dataarray(self):
+        """Create a time/band/y/x DataArray with three bands."""
+        data = np.random.rand(2, 3, 4, 4)  # 2 dates, 3 bands, 4x4 pixels
+        coords = {
+            "time": np.array(["2024-01-01", "2024-01-06"], dtype="datetime64[ns]"),
+            "band": ["B04", "B03", "B02"],
+            "y": np.linspace(40, 41, 4),
+            "x": np.linspace(-91, -90, 4),
+        }
+        return xr.DataArray(data, coords=coords, dims=["time", "band", "y", "x"])
+
+    def test_scale_data_xarray_none(self, dataarray):
+        """Test that no scaling factors returns the input unchanged."""
+        expected = dataarray.copy()
+
+        result = scale_data_xarray(dataarray)
+
+        assert result is dataarray
+        xr.testing.assert_identical(result, expected)
+
+    def test_scale_data_xarray_all_ones(self, dataarray):
+        """Test that scaling factors of 1 leave every band unchanged."""
+        expected = dataarray.copy()
+
+        result = scale_data_xarray(dataarray, [1, 1, 1])
+
+        xr.testing.assert_identical(result, expected)
+
+    def test_scale_data_xarray_mixed(self, dataarray):
+        """Test that only the bands with a scaling factor other than 1 are scaled."""
+        expected = dataarray.copy()
+
+        result = scale_data_xarray(dataarray, [1, 0.0001, 2])
+
+        xr.testing.assert_identical(result.sel(band="B04"), expected.sel(band="B04"))
+        np.testing.assert_allclose(
+            result.sel(band="B03"), expected.sel(band="B03") * 0.0001
+        )
+        np.testing.assert_allclose(result.sel(band="B02"), expected.sel(band="B02") * 2)
@@ -3,6 +3,7 @@
 
 
 from terrakit.general_utils.geospatial_util import clip_box, reproject_bbox
+import numpy as np
 import pytest
 
 from tests.component_tests.component_tests_util import create_xarray
@@ -64,9 +65,9 @@ def test_clip_box(min_x, min_y, max_x, max_y, size_x, size_y, is_360_degree_syst
     )
     clipped_da = clip_box(data=da, bbox=reprojected_bbox, x_dim=x_dim, y_dim=y_dim)
     # validate if coords are correct
-    for x in clipped_da[x_dim].values:
-        assert x >= reprojected_bbox[0] - delta_space
-        assert x <= reprojected_bbox[2] + delta_space
-    for y in clipped_da[y_dim].values:
-        assert y >= reprojected_bbox[1] - delta_space
-        assert y <= reprojected_bbox[3] + delta_space
+    xs = clipped_da[x_dim].values
+    assert np.all(xs >= reprojected_bbox[0] - delta_space)
+    assert np.all(xs <= reprojected_bbox[2] + delta_space)
+    ys = clipped_da[y_dim].values
+    assert np.all(ys >= reprojected_bbox[1] - delta_space)
+    assert np.all(ys <= reprojected_bbox[3] + delta_space)
@@ -2,49 +2,69 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import os
 import pytest
 import shutil
 
-from pathlib import Path
+from tests.component_tests.component_tests_util import link_or_copy
+
 
 DUMMY_DATA_DIR = "./tests/resources/component_test_data/store"
-WORKING_DIR = f"{DUMMY_DATA_DIR}/tmp"
 
 
 @pytest.fixture
-def taco_setup():
+def store_working_dir(tmp_path) -> str:
+    """
+    Per-test working directory for the store tests. pytest removes it, and each
+    xdist worker gets its own, so the store tests can run in parallel.
+    """
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def _reference_dummy_tifs(tmp_path_factory) -> dict[str, str]:
+    """
+    Copy the dummy data and label tifs into the session tmp dir once, so that
+    taco_setup can hardlink from a source on the same filesystem as tmp_path.
+    """
+    ref_dir = tmp_path_factory.mktemp("store_reference")
+    refs = {}
+    for kind in ("data", "label"):
+        src = f"{DUMMY_DATA_DIR}/dummy_2025-01-01_imputed_0.{kind}.tif"
+        refs[kind] = shutil.copy(src, ref_dir)
+    return refs
+
+
+@pytest.fixture
+def taco_setup(store_working_dir, _reference_dummy_tifs):
     """
     Set up test copying a dummy tif file into the working directory.
     One file is called `dummy_imputed.tif`, while the other is called
     `dummy_imputed_labels.tif`.
     """
     print("Setting up test data")
-    Path(WORKING_DIR).mkdir(parents=True, exist_ok=True)
     for i in range(1, 10):
-        shutil.copy(
-            f"{DUMMY_DATA_DIR}/dummy_2025-01-01_imputed_0.data.tif",
-            f"{WORKING_DIR}/dummy_2025-01-01_imputed_{i}.data.tif",
-        )
-        shutil.copy(
-            f"{DUMMY_DATA_DIR}/dummy_2025-01-01_imputed_0.label.tif",
-            f"{WORKING_DIR}/dummy_2025-01-01_imputed_{i}.label.tif",
-        )
+        for kind, ref in _reference_dummy_tifs.items():
+            link_or_copy(
+                ref, f"{store_working_dir}/dummy_2025-01-01_imputed_{i}.{kind}.tif"
+            )
 
 
-@pytest.fixture
-def create_dummy_shpfile():
-    Path(f"{WORKING_DIR}/test_dataset_labels.prj").touch()
-    Path(f"{WORKING_DIR}/test_dataset_labels.dbf").touch()
-    Path(f"{WORKING_DIR}/test_dataset_labels.shp").touch()
-    Path(f"{WORKING_DIR}/test_dataset_labels.shx").touch()
-    Path(f"{WORKING_DIR}/test_dataset_all_bboxes.cpg").touch()
-    Path(f"{WORKING_DIR}/test_dataset_all_bboxes.prj").touch()
-    Path(f"{WORKING_DIR}/test_dataset_all_bboxes.dbf").touch()
-    Path(f"{WORKING_DIR}/test_dataset_all_bboxes.shp").touch()
-    Path(f"{WORKING_DIR}/test_dataset_all_bboxes.shx").touch()
+DUMMY_SHPFILES = {
+    "test_dataset_labels": (".prj", ".dbf", ".shp", ".shx"),
+    "test_dataset_all_bboxes": (".cpg", ".prj", ".dbf", ".shp", ".shx"),
+}
+
+
+def _fast_touch(path: str) -> None:
+    """
+    Create an empty file without the extra utime call made by Path.touch.
+    """
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o644))
 
 
 @pytest.fixture
-def store_cleanup():
-    yield
-    shutil.rmtree(WORKING_DIR)
+def create_dummy_shpfile(store_working_dir):
+    for base, exts in DUMMY_SHPFILES.items():
+        for ext in exts:
+            _fast_touch(f"{store_working_dir}/{base}{ext}")
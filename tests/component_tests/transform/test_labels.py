@@ -20,6 +20,9 @@ from tests.component_tests.transform.conftest import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name="working_dir")
+
+
 class TestLabels_WorkingDir:
     def test_process_labels__working_dir_default(
         self, process_labels_clean_up_default_working_dir
@@ -27,6 +27,9 @@ from tests.component_tests.transform.conftest import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name="working_dir")
+
+
 class TestLabels_WorkingDir_FailureTests:
     def test_process_labels__working_dir_invalid_not_directory(
         self, process_labels_clean_up_working_dir
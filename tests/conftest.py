@@ -7,11 +7,52 @@ import pytest
 import shutil
 
 DEFAULT_WORKING_DIR = "./tmp"
+# One sqlite file per xdist worker, so the workers never write to the same file.
+REQUESTS_CACHE_PATH = ".cache/requests-cache-{worker}.sqlite"
+REQUESTS_CACHE_EXPIRE_AFTER = 43200  # seconds
+# Credential requests must not be cached: the sqlite file would hold the request
+# body (client secrets, passwords) and replay tokens after they have expired.
+REQUESTS_CACHE_DO_NOT_CACHE_URLS = ("*token*", "*s3credentials*")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Cache HTTP responses from requests in "
+        f"{REQUESTS_CACHE_PATH.format(worker='<xdist worker>')}.",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def use_requests_cache(request):
+    if not request.config.getoption("--use-requests-cache"):
+        yield
+        return
+    try:
+        import requests_cache
+    except ImportError:
+        raise pytest.UsageError(
+            "--use-requests-cache requires requests-cache from the dev dependency "
+            "group. Install it with `uv sync`."
+        )
+    requests_cache.install_cache(
+        REQUESTS_CACHE_PATH.format(worker=os.getenv("PYTEST_XDIST_WORKER", "main")),
+        backend="sqlite",
+        expire_after=REQUESTS_CACHE_EXPIRE_AFTER,
+        urls_expire_after={
+            url: requests_cache.DO_NOT_CACHE for url in REQUESTS_CACHE_DO_NOT_CACHE_URLS
+        },
+        # POST is needed for the STAC searches, which are keyed by request body.
+        allowable_methods=("GET", "POST"),
+    )
+    yield
+    requests_cache.uninstall_cache()
 
 
 @pytest.fixture
 def default_dir_clean_up():
     yield
     print(f"Test clean up. Deleting {DEFAULT_WORKING_DIR}")
-    if os.path.exists(DEFAULT_WORKING_DIR):
-        shutil.rmtree(DEFAULT_WORKING_DIR)
+    shutil.rmtree(DEFAULT_WORKING_DIR, ignore_errors=True)
@@ -4,11 +4,10 @@
 
 # TerraKit - easy Geospatial data search and query
 # Requires tokens for data connectors in .env
-import numpy as np
 import os
 import xarray as xr
 
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 from shutil import rmtree
 
 from rasterio.crs import CRS
@@ -19,12 +18,18 @@ from terrakit.download.transformations.scale_data_xarray import scale_data_xarra
 from terrakit.download.geodata_utils import save_data_array_to_file
 
 
-############## CLEAN UP FUNCTIONS #################
+############## CLEAN UP FUNCTIONS #################
 def get_data_clean_up(save_file_dir):
-    files = glob(f"{save_file_dir}/*.tif")
-    print(f"Test clean up. Deleting {files}")
-    for f in files:
-        os.remove(f)
+    print(f"Test clean up. Deleting tifs in {save_file_dir}")
+    with os.scandir(save_file_dir) as entries:
+        for e in entries:
+            if e.name.endswith(".tif"):
+                os.unlink(e.path)
+
+
+def count_tifs(save_file_dir, suffix=".tif"):
+    with os.scandir(save_file_dir) as entries:
+        return sum(1 for e in entries if e.name.endswith(suffix))
 
 
 SAVE_FILE_DIR = "./tests/resources/intergration_test_data"
@@ -39,284 +44,101 @@ date_end = "2024-01-31"
 ###################################################
 
 
-# Example 1
-data_connector = "sentinelhub"
-dc = DataConnector(connector_type="sentinelhub")
-dc.connector.list_collections()
-
-collection_name = "s2_l2a"
-
-bands = ["B04", "B03", "B02"]
-
-unique_dates, results = dc.connector.find_data(
-    data_collection_name=collection_name,
-    date_start=date_start,
-    date_end=date_end,
-    bbox=bbox,
-    bands=bands,
-)
-
-print(unique_dates)
-
-save_file = f"{SAVE_FILE_DIR}/{data_connector}_{collection_name}.tif"
-
-# Single day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[0],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == 1
-get_data_clean_up(SAVE_FILE_DIR)
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True
-)
-get_data_clean_up(SAVE_FILE_DIR)
-
-# Multi day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[-1],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == len(unique_dates)
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True
-)
-get_data_clean_up(SAVE_FILE_DIR)
-
-
-#############################################################################
-# Example 2                                                                 #
-#############################################################################
-collection_name = "s1_grd"
-bands = ["VV", "VH"]
-
-unique_dates, results = dc.connector.find_data(
-    data_collection_name=collection_name,
-    date_start=date_start,
-    date_end=date_end,
-    bbox=bbox,
-    bands=bands,
-)
-
-print(unique_dates)
-
-date = unique_dates[0]
-save_file = f"{SAVE_FILE_DIR}/{data_connector}_{collection_name}.tif"
-
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[0],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == 1
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True
-)
-get_data_clean_up(SAVE_FILE_DIR)
-
-# Multi day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[-1],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == len(unique_dates)
-get_data_clean_up(SAVE_FILE_DIR)
-
-
-#############################################################################
-# Example 3                                                                 #
-#############################################################################
-data_connector = "sentinel_aws"
-dc = DataConnector(connector_type=data_connector)
-dc.connector.list_collections()
-
-collection_name = "sentinel-2-l2a"
-bands = ["blue", "green", "red"]
-
-unique_dates, results = dc.connector.find_data(
-    data_collection_name=collection_name,
-    date_start=date_start,
-    date_end=date_end,
-    bbox=bbox,
-    bands=bands,
-)
-
-print(unique_dates)
-
-save_file = f"{SAVE_FILE_DIR}/{data_connector}_{collection_name}.tif"
-
-# Single Day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[0],
-    bbox=bbox,
-    bands=bands,
-    save_file=f"{save_file}",
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-)  ### TODO: FAILING TO SAVE SINGLE FILE
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == 1
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True
-)
-get_data_clean_up(SAVE_FILE_DIR)
-
-# Multi Day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[-1],
-    bbox=bbox,
-    bands=bands,
-    save_file=f"{save_file}",
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == len(unique_dates)
-get_data_clean_up(SAVE_FILE_DIR)
+def check_data_array(da, bands):
+    assert isinstance(da, xr.DataArray)
+    assert da.rio.crs == CRS.from_epsg(4326)
+    assert len(da.coords["band"]) == len(bands)
+    assert len(da.time) >= 1
+
+
+def check_imputed(da, bands, save_file, date):
+    dai = scale_data_xarray(da, [1.0] * len(bands))
+    dai = impute_nans_xarray(dai)
+    save_data_array_to_file(dai, save_file=save_file, imputed=True)
+
+    assert os.path.exists(save_file.replace(".tif", f"_{date}_imputed.tif"))
+
+
+def run_example(data_connector, collection_name, bands, check_all_dates=False):
+    """
+    Run find_data and a single and multi day get_data for one collection.
+
+    Each example saves to and downloads through its own directory under
+    SAVE_FILE_DIR. The connectors keep scratch data (e.g. sentinelhub's sh_data)
+    in working_dir and wipe it before and after each download, so a shared
+    working_dir would let concurrent examples delete each other's files.
+    """
+    save_dir = f"{SAVE_FILE_DIR}/{data_connector}_{collection_name}"
+    os.makedirs(save_dir, exist_ok=True)
+
+    dc = DataConnector(connector_type=data_connector)
+    dc.connector.list_collections()
+
+    unique_dates, results = dc.connector.find_data(
+        data_collection_name=collection_name,
+        date_start=date_start,
+        date_end=date_end,
+        bbox=bbox,
+        bands=bands,
+    )
+
+    print(unique_dates)
+
+    save_file = f"{save_dir}/{data_connector}_{collection_name}.tif"
+
+    # Single day
+    da = dc.connector.get_data(
+        data_collection_name=collection_name,
+        date_start=unique_dates[0],
+        date_end=unique_dates[0],
+        bbox=bbox,
+        bands=bands,
+        save_file=save_file,
+        working_dir=save_dir,
+    )
+
+    check_data_array(da, bands)
+    assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif"))
+    assert count_tifs(save_dir, suffix=f"{unique_dates[0]}.tif") == 1
+    get_data_clean_up(save_dir)
+
+    check_imputed(da, bands, save_file, unique_dates[0])
+    get_data_clean_up(save_dir)
+
+    # Multi day
+    da = dc.connector.get_data(
+        data_collection_name=collection_name,
+        date_start=unique_dates[0],
+        date_end=unique_dates[-1],
+        bbox=bbox,
+        bands=bands,
+        save_file=save_file,
+        working_dir=save_dir,
+    )
+
+    check_data_array(da, bands)
+    with os.scandir(save_dir) as entries:
+        present = {e.path for e in entries if e.name.endswith(".tif")}
+    dates = unique_dates if check_all_dates else unique_dates[:1]
+    expected = {save_file.replace(".tif", f"_{d}.tif") for d in dates}
+    assert expected <= present, f"No tif saved for {sorted(expected - present)}"
+    assert len(present) == len(unique_dates)
+
+    check_imputed(da, bands, save_file, unique_dates[0])
+    get_data_clean_up(save_dir)
 
 
 #############################################################################
-# Example 4                                                                 #
+# Examples                                                                  #
 #############################################################################
-data_connector = "nasa_earthdata"
-dc = DataConnector(connector_type=data_connector)
-dc.connector.list_collections()
-
-collection_name = "HLSL30_2.0"
-bands = ["B04", "B03", "B02"]
-
-unique_dates, results = dc.connector.find_data(
-    data_collection_name=collection_name,
-    date_start=date_start,
-    date_end=date_end,
-    bbox=bbox,
-    bands=["B04", "B03", "B02"],
-)
-
-print(unique_dates)
-
-save_file = f"{SAVE_FILE_DIR}/{data_connector}_{collection_name}.tif"
-
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[0],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-assert os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*{unique_dates[0]}.tif")) == 1
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True
-)
-get_data_clean_up(SAVE_FILE_DIR)
-
-
-# Multi Day
-da = dc.connector.get_data(
-    data_collection_name=collection_name,
-    date_start=unique_dates[0],
-    date_end=unique_dates[-1],
-    bbox=bbox,
-    bands=bands,
-    save_file=save_file,
-)
-
-assert isinstance(da, xr.DataArray)
-assert da.rio.crs == CRS.from_epsg(4326)
-assert len(da.coords["band"]) == len(bands)
-assert len(da.time) >= 1
-for date in unique_dates:
-    assert os.path.exists(save_file.replace(".tif", f"_{date}.tif")) is True
-assert len(glob(f"{SAVE_FILE_DIR}/*.tif")) == len(unique_dates)
-
-dai = scale_data_xarray(da, list(np.ones(len(bands))))
-dai = impute_nans_xarray(dai)
-save_data_array_to_file(dai, save_file=save_file, imputed=True)
-
-assert (
-    os.path.exists(save_file.replace(".tif", f"_{unique_dates[0]}_imputed.tif")) is True  # type: ignore[index]
-)
-get_data_clean_up(SAVE_FILE_DIR)
+# The connectors use independent endpoints, so run the examples concurrently.
+EXAMPLES = [
+    ("sentinelhub", "s2_l2a", ["B04", "B03", "B02"]),
+    ("sentinelhub", "s1_grd", ["VV", "VH"]),
+    ("sentinel_aws", "sentinel-2-l2a", ["blue", "green", "red"]),
+    ("nasa_earthdata", "HLSL30_2.0", ["B04", "B03", "B02"], True),
+]
+
+with ThreadPoolExecutor(max_workers=len(EXAMPLES)) as ex:
+    # Consuming the iterator re-raises the first failing example.
+    list(ex.map(lambda example: run_example(*example), EXAMPLES))
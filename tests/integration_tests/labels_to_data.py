@@ -2,12 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import hashlib
+import json
 import os
 import pandas as pd
 import rasterio
 import shutil
+import tempfile
+import threading
 
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from terrakit.chip.tiling import chip_and_label_data
@@ -27,33 +31,105 @@ from terrakit.general_utils.labels_downloader import (
 
 DATASET_NAME = "test_dataset"
 WORKING_DIR = f"./tests/resources/intergration_test_data/{DATASET_NAME}"
+# Set LABELS_TO_DATA_CACHE=1 to reuse the downloaded and chipped data from an
+# earlier run with the same config and labels.
+CACHE_ROOT = "./.cache/labels_to_data"
+
+
+def discard_dir(path):
+    """
+    Move a directory out of the way and delete it on a background thread. The
+    thread is not a daemon, so the interpreter still waits for it on exit.
+    """
+    if not os.path.exists(path):
+        return
+    trash = tempfile.mkdtemp(prefix=".trash_", dir=os.path.dirname(path))
+    os.rename(path, os.path.join(trash, os.path.basename(path)))
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def link_or_copy(src, dst):
+    # Tifs are only read after chipping, so they can be shared with the cache.
+    # Other files (e.g. the metadata json) are rewritten in place, so copy them.
+    if os.path.exists(dst):
+        os.remove(dst)
+    if src.endswith(".tif"):
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def get_cache_dir(config):
+    if not os.getenv("LABELS_TO_DATA_CACHE"):
+        return None
+    key = hashlib.blake2b(json.dumps(config, sort_keys=True).encode(), digest_size=16)
+    # Hash every file of the labels shapefile (.shp, .shx, .dbf, .prj, .cpg, ...),
+    # since a change to any of them changes the labels.
+    for path in sorted(Path(WORKING_DIR).glob(f"{DATASET_NAME}_labels.*")):
+        key.update(path.name.encode())
+        key.update(path.read_bytes())
+    return f"{CACHE_ROOT}/{key.hexdigest()}"
+
+
+def restore_from_cache(cache_dir):
+    if cache_dir is None or not os.path.exists(f"{cache_dir}/.done"):
+        return False
+    print(f"Restoring downloaded and chipped data from {cache_dir}")
+    shutil.copytree(
+        cache_dir,
+        WORKING_DIR,
+        ignore=shutil.ignore_patterns(".done"),
+        copy_function=link_or_copy,
+        dirs_exist_ok=True,
+    )
+    return True
+
+
+def save_to_cache(cache_dir):
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    shutil.copytree(WORKING_DIR, cache_dir, copy_function=link_or_copy)
+    open(f"{cache_dir}/.done", "w").close()
+
+
+def read_band1(path):
+    # Skip the sidecar (.aux.xml, .msk, .ovr) probes. Each call opens its own,
+    # unshared dataset handle so the concurrent reads do not contend on GDAL's
+    # dataset pool.
+    with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+        with rasterio.open(path, sharing=False) as src:
+            return src.read(1)
 
 
 # Setup
 print(f"Test setup up. Deleting {WORKING_DIR}")
-if os.path.exists(WORKING_DIR):
-    shutil.rmtree(WORKING_DIR)
+discard_dir(WORKING_DIR)
 
 # Download example labels if these do not already exist:
 example_labels_dir = "docs/examples/test_wildfire_vector/"
-if (
-    Path(example_labels_dir).is_dir() is False
-    or set(EXAMPLE_LABEL_FILES).issubset(glob(f"{example_labels_dir}/*.json")) is False
+if not (
+    Path(example_labels_dir).is_dir()
+    and set(EXAMPLE_LABEL_FILES).issubset(os.listdir(example_labels_dir))
 ):
-    rapid_mapping_geojson_downloader(
-        event_id="748",
-        aoi="01",
-        monitoring_number="05",
-        version="v1",
-        dest="docs/examples/test_wildfire_vector",
-    )
-    rapid_mapping_geojson_downloader(
-        event_id="801",
-        aoi="01",
-        monitoring_number="02",
-        version="v1",
-        dest="docs/examples/test_wildfire_vector",
-    )
+    # The two events are independent downloads, so fetch them concurrently.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = [
+            ex.submit(
+                rapid_mapping_geojson_downloader,
+                event_id=event_id,
+                aoi="01",
+                monitoring_number=monitoring_number,
+                version="v1",
+                dest="docs/examples/test_wildfire_vector",
+            )
+            for event_id, monitoring_number in [("748", "05"), ("801", "02")]
+        ]
+    for future in futures:
+        future.result()
 
 # Complete
 print("End...\n\n")
@@ -77,9 +153,9 @@ labels_gdf, grouped_bbox_gdf = process_labels(
 # Validate
 assert isinstance(grouped_bbox_gdf, pd.DataFrame)
 assert "datetime" in list(grouped_bbox_gdf.columns.values)
-assert "test_dataset_all_bboxes.shp" in os.listdir(WORKING_DIR)
+assert (Path(WORKING_DIR) / "test_dataset_all_bboxes.shp").exists()
 assert "geometry" in list(labels_gdf.columns.values)
-assert "test_dataset_labels.shp" in os.listdir(WORKING_DIR)
+assert (Path(WORKING_DIR) / "test_dataset_labels.shp").exists()
 
 # Completed
 print("End....\n\n")
@@ -111,16 +187,19 @@ config = {
     },
 }
 
-queried_data = download_data(
-    dataset_name=DATASET_NAME,
-    data_sources=config["download"]["data_sources"],
-    date_allowance=config["download"]["date_allowance"],
-    transform=config["download"]["transform"],
-    working_dir=WORKING_DIR,
-    keep_files=False,
-)
-# Check queried data is come back as with len(queried_data) > 0
-assert len(queried_data) > 0
+cache_dir = get_cache_dir(config)
+restored_from_cache = restore_from_cache(cache_dir)
+if not restored_from_cache:
+    queried_data = download_data(
+        dataset_name=DATASET_NAME,
+        data_sources=config["download"]["data_sources"],
+        date_allowance=config["download"]["date_allowance"],
+        transform=config["download"]["transform"],
+        working_dir=WORKING_DIR,
+        keep_files=False,
+    )
+    # Check queried data is come back as with len(queried_data) > 0
+    assert len(queried_data) > 0
 
 ####################################################################
 #                                                                  #
@@ -129,31 +208,33 @@ print("\n\nTEST 3.1... Chip the data")  #
 ####################################################################
 # Now that the tiled data has been downloaded, let's chip it accordingly.
 
-res = chip_and_label_data(
-    dataset_name=DATASET_NAME,
-    sample_dim=256,
-    queried_data=queried_data,
-    keep_files=True,
-)
-assert len(res) > 0
-
-# Clean up and re-run using working dir
-chips = glob(f"{WORKING_DIR}/*.data.tif")
-labels = glob(f"{WORKING_DIR}/*.label.tif")
-for chip in chips:
-    os.remove(chip)
-
-for label in labels:
-    os.remove(label)
-
-# Run again using working dir
-res = chip_and_label_data(
-    dataset_name=DATASET_NAME,
-    sample_dim=256,
-    working_dir=WORKING_DIR,
-    keep_files=False,
-)
-assert len(res) > 0
+if not restored_from_cache:
+    res = chip_and_label_data(
+        dataset_name=DATASET_NAME,
+        sample_dim=256,
+        queried_data=queried_data,
+        keep_files=True,
+    )
+    assert len(res) > 0
+
+    # Clean up and re-run using working dir
+    with os.scandir(WORKING_DIR) as entries:
+        chips_and_labels = [
+            e.path for e in entries if e.name.endswith((".data.tif", ".label.tif"))
+        ]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(os.remove, chips_and_labels))
+
+    # Run again using working dir
+    res = chip_and_label_data(
+        dataset_name=DATASET_NAME,
+        sample_dim=256,
+        working_dir=WORKING_DIR,
+        keep_files=False,
+    )
+    assert len(res) > 0
+    if cache_dir:
+        save_to_cache(cache_dir)
 ####################################################################
 #                                                                  #
 # # ## 4. Store                                                    #
@@ -166,7 +247,7 @@ taco_store_data(
     save_dir=WORKING_DIR,
     tortilla_name="terrakit_curated_dataset.tortilla",
 )
-assert "terrakit_curated_dataset.tortilla" in os.listdir(WORKING_DIR)
+assert (Path(WORKING_DIR) / "terrakit_curated_dataset.tortilla").exists()
 
 ####################################################################
 #                                                                  #
@@ -183,26 +264,21 @@ print("\n\nTEST 6.1... Dataset factory integration test")  #
 # Confirm labels and data files are correctly names with appropriate file suffixes.
 file_suffix = "data.tif"
 label_suffix = "label.tif"
-files = sorted(
-    glob(
-        WORKING_DIR + "/**/*" + file_suffix,
-        recursive=True,
-    )
-)
+files = []
+label_files = []
+for root, _, names in os.walk(WORKING_DIR):
+    for name in names:
+        if name.endswith(file_suffix):
+            files.append(os.path.join(root, name))
+        elif name.endswith(label_suffix):
+            label_files.append(os.path.join(root, name))
+files.sort()
+label_files.sort()
 assert len(files) > 0
-
-label_files = sorted(
-    glob(
-        WORKING_DIR + "/**/*" + label_suffix,
-        recursive=True,
-    )
-)
 assert len(label_files) > 0
 
-image_stems = [filepath.replace(file_suffix, "").split("/")[-1] for filepath in files]
-label_stems = [
-    filepath.replace(label_suffix, "").split("/")[-1] for filepath in label_files
-]
+image_stems = [os.path.basename(f).removesuffix(file_suffix) for f in files]
+label_stems = [os.path.basename(f).removesuffix(label_suffix) for f in label_files]
 
 assert image_stems == label_stems
 
@@ -216,12 +292,18 @@ print("\n\nTEST 7.1... Verify label and data statistics")  #
 # Verify statistics
 print("\n.\n.\n.\n.\n.\nVerifying statistics....\n.")
 target_tif = "sentinel_aws_sentinel-2-l2a_2024-08-30_imputed_20"
+target_label_path = Path(WORKING_DIR) / f"{target_tif}.label.tif"
+target_data_path = Path(WORKING_DIR) / f"{target_tif}.data.tif"
 verified_label_stats, verified_data_stats, verified_mask_stats = load_verified_stats()
 
+# GDAL releases the GIL while reading, so load the label and data rasters together.
+with ThreadPoolExecutor(max_workers=2) as ex:
+    target_mask, target_data = ex.map(
+        read_band1, [target_label_path, target_data_path]
+    )
+
 # Check the corresponding labels file that has just been generated has the same stats.
 print("Validating labels...")
-with rasterio.open(f"{WORKING_DIR}/{target_tif}.label.tif") as src_mask:
-    target_mask = src_mask.read(1)
 target_label_stats = [mean_val, median_val, min_val, max_val, std_dev, count] = (
     compute_stats(target_mask)
 )
@@ -229,8 +311,6 @@ assert verified_label_stats == target_label_stats
 
 # Check the corresponding data file that has just been generated has the same stats.
 print("Validating data...")
-with rasterio.open(f"{WORKING_DIR}/{target_tif}.data.tif") as src_mask:
-    target_data = src_mask.read(1)
 target_data_stats = [mean_val, median_val, min_val, max_val, std_dev, count] = (
     compute_stats(target_data)
 )
@@ -249,8 +329,7 @@ assert verified_mask_stats == target_mask_stats
 print(f"\n\nTest clean up. Deleting {WORKING_DIR}")  #
 #                                                                  #
 ####################################################################
-if os.path.exists(WORKING_DIR):
-    shutil.rmtree(WORKING_DIR)
+discard_dir(WORKING_DIR)
 
 # Complete
 print("Tests passed...\n\n")
@@ -5,21 +5,39 @@
 import pytest
 import os
 
+from terrakit.__main__ import main
+
+
+pytestmark = pytest.mark.xdist_group(name="working_dir")
+
+
+def run_cli(monkeypatch, *args: str) -> int:
+    """Run the terrakit CLI in-process and return its exit status."""
+    monkeypatch.setattr("sys.argv", ["terrakit", *args])
+    try:
+        main()
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
 
 def test_entrypoint():
+    # Spawned for real so that the installed console script is covered too.
     exit_status = os.system("terrakit --help")
     assert exit_status == 0
 
 
 @pytest.mark.parametrize("action", ["labels"])
-def test_cli(action, default_dir_clean_up):
-    exit_status = os.system(f"terrakit --config docs/examples/config.yaml {action}")
+def test_cli(action, monkeypatch, default_dir_clean_up):
+    exit_status = run_cli(monkeypatch, "--config", "docs/examples/config.yaml", action)
     assert exit_status == 0
 
 
-def test_cli_invaild_action(default_dir_clean_up):
+def test_cli_invaild_action(monkeypatch, default_dir_clean_up):
     invalid_action = "nothing"
-    exit_status = os.system(
-        f"terrakit --config docs/examples/config.yaml {invalid_action}"
+    exit_status = run_cli(
+        monkeypatch, "--config", "docs/examples/config.yaml", invalid_action
     )
     assert exit_status != 0
@@ -8,7 +8,10 @@ import xarray as xr
 import pytest
 
 
-@pytest.fixture(scope="module")
+pytestmark = pytest.mark.live
+
+
+@pytest.fixture(scope="session")
 def data_conn() -> Connector:
     conn = IBMResearchSTAC()
     return conn
@@ -35,24 +38,21 @@ def test_load_collections(data_conn: Connector):
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "data_collection_name,bbox,date_start,date_end,data_conn",
+    "data_collection_name,bbox,date_start,date_end",
     [
         (
             "sentinel-5p-l3grd-ch4-wfmd",
             (-102.0, 31.0, -101.0, 32.0),
             "2024-01-01",
             "2024-02-01",
-            "data_conn",
         ),
         (
             "nex-gddp-cmip6-historical",
             (-102.0, 31.0, -101.0, 32.0),
             "2009-01-01",
             "2009-02-01",
-            "data_conn",
         ),
     ],
-    indirect=["data_conn"],
 )
 def test_find_data(
     data_collection_name: str,
@@ -79,17 +79,15 @@ def test_find_data(
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "data_collection_name,bbox,date_start,date_end,data_conn",
+    "data_collection_name,bbox,date_start,date_end",
     [
         (
             "HLS_S30",
             (-102.0, 31.0, -101.0, 32.0),
             "2024-01-01",
             "2024-02-01",
-            "data_conn",
         )
     ],
-    indirect=["data_conn"],
 )
 def test_find_data_invalid(
     data_collection_name: str,
@@ -110,7 +108,7 @@ def test_find_data_invalid(
 
 @pytest.mark.slow
 @pytest.mark.parametrize(
-    "data_collection_name,bbox,date_start,date_end,bands, expected_sizes, data_conn",
+    "data_collection_name,bbox,date_start,date_end,bands, expected_sizes",
     [
         (
             "sentinel-5p-l3grd-ch4-wfmd",
@@ -119,7 +117,6 @@ def test_find_data_invalid(
             "2024-01-03",
             ["CH4_column_volume_mixing_ratio"],
             {"longitude": 4, "latitude": 4, "time": 3, "bands": 1},
-            "data_conn",
         ),
         (
             "sentinel-5p-l3grd-ch4-wfmd",
@@ -128,7 +125,6 @@ def test_find_data_invalid(
             "2024-01-02",
             ["CH4_column_volume_mixing_ratio"],
             {"bands": 1, "time": 2, "latitude": 24, "longitude": 24},
-            "data_conn",
         ),
         (
             "ch4",
@@ -137,7 +133,6 @@ def test_find_data_invalid(
             "2025-01-02",
             ["CH4_column_volume_mixing_ratio_dry_air"],
             {"longitude": 4, "latitude": 4, "time": 2, "bands": 1},
-            "data_conn",
         ),
         (
             "nex-gddp-cmip6-historical",
@@ -146,10 +141,8 @@ def test_find_data_invalid(
             "2001-01-02",
             ["pr"],
             {"lon": 4, "lat": 4, "time": 731, "bands": 1},
-            "data_conn",
         ),
     ],
-    indirect=["data_conn"],
 )
 def test_get_data(
     data_collection_name: str,
@@ -9,7 +9,7 @@ import pytest
 import pandas as pd
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def data_conn() -> Connector:
     conn = TheWeatherCompany()
     return conn
@@ -30,17 +30,15 @@ def test_load_collections(data_conn: Connector):
 
 
 @pytest.mark.parametrize(
-    "data_collection_name,bbox,date_start, time_delta,data_conn",
+    "data_collection_name,bbox,date_start, time_delta",
     [
         (
             "sentinel-5p-l3grd-ch4-wfmd",
             (-102.0, 31.0, -101.0, 32.0),
             pd.Timestamp.today().date().isoformat(),
             15,
-            "data_conn",
         )
     ],
-    indirect=["data_conn"],
 )
 def test_find_data(
     data_collection_name: str,
@@ -65,8 +63,9 @@ def test_find_data(
 
 
 @pytest.mark.slow
+@pytest.mark.live
 @pytest.mark.parametrize(
-    "data_collection_name,bbox,date_start, days_in_advance,bands, expected_sizes, data_conn",
+    "data_collection_name,bbox,date_start, days_in_advance,bands, expected_sizes",
     [
         (
             "weathercompany-daily-forecast",
@@ -75,10 +74,8 @@ def test_find_data(
             15,
             ["temperatureMax", "temperatureMin"],
             {"longitude": 8, "latitude": 8, "time": 15, "bands": 2},
-            "data_conn",
         ),
     ],
-    indirect=["data_conn"],
 )
 def test_get_data(
     data_collection_name: str,